@@ -1 +1,44 @@
-__all__=[]
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Project Management System application package
+Пакет приложения системы управления проектами
+
+Public names are resolved lazily on first access (PEP 562), so that
+``import app`` does not pull in PyQt6 or SQLAlchemy.
+
+Публичные имена загружаются лениво при первом обращении (PEP 562),
+чтобы ``import app`` не загружал PyQt6 и SQLAlchemy.
+"""
+
+import importlib
+from typing import TYPE_CHECKING
+
+__version__ = "1.0.0"
+
+if TYPE_CHECKING:
+    from app.core.application import ProjectManagerApp
+    from app.core.config import Config, ConfigManager
+    from app.database.connection import DatabaseManager
+
+_LAZY = {
+    "ProjectManagerApp": "app.core.application",
+    "Config": "app.core.config",
+    "ConfigManager": "app.core.config",
+    "DatabaseManager": "app.database.connection",
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name):
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY))
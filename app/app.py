@@ -1,5 +1,7 @@
 import sys
+import logging
 from PyQt6 import QtWidgets
+from PyQt6.QtCore import QTimer
 from app.config import Settings
 from app.logging_conf import configure_logging
 from app.db.connection import Database
@@ -13,8 +15,10 @@ class ProjectApp(QtWidgets.QApplication):
         self.setApplicationName('Project Management System')
         self.settings = AppSettings()
         self.cfg = Settings.load()
-        configure_logging(self.cfg)
-        self.db = Database(self.cfg.database_url)
+        # Minimal handler until full logging is configured after startup
+        logging.basicConfig(level=logging.WARNING)
+        QTimer.singleShot(0, lambda: configure_logging(self.cfg))
+        self.db = Database(self.cfg.database_url, self.cfg.pool_size, self.cfg.max_overflow)
         self.db.ensure_initialized()
         self.window = MainWindow(self)
     def run(self):
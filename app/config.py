@@ -1,12 +1,43 @@
-from pydantic import BaseModel
+import json
+from dataclasses import dataclass, fields
 from pathlib import Path
 
-class Settings(BaseModel):
+SETTINGS_PATH = Path('data/settings.json')
+
+# Parsed settings keyed by file path -> ((mtime_ns, size), Settings)
+_CACHE: dict = {}
+_DATA_DIR_READY = False
+
+@dataclass(slots=True, frozen=True)
+class Settings:
     database_url: str = f"sqlite:///{Path('data/db.sqlite').as_posix()}"
     locale: str = 'ru'
     backup_dir: str = 'backups'
     log_level: str = 'INFO'
+    pool_size: int = 5
+    max_overflow: int = 10
     @classmethod
     def load(cls):
-        Path('data').mkdir(exist_ok=True, parents=True)
-        return cls()
+        global _DATA_DIR_READY
+        if not _DATA_DIR_READY:
+            Path('data').mkdir(exist_ok=True, parents=True)
+            _DATA_DIR_READY = True
+        try:
+            st = SETTINGS_PATH.stat()
+            key = (st.st_mtime_ns, st.st_size)
+        except FileNotFoundError:
+            key = None
+        hit = _CACHE.get(str(SETTINGS_PATH))
+        if hit is not None and hit[0] == key:
+            return hit[1]
+        obj = cls._from_file() if key else cls()
+        _CACHE[str(SETTINGS_PATH)] = (key, obj)
+        return obj
+    @classmethod
+    def _from_file(cls):
+        data = json.loads(SETTINGS_PATH.read_text(encoding='utf-8'))
+        names = {f.name for f in fields(cls)}
+        return cls(**{k: v for k, v in data.items() if k in names})
+    @classmethod
+    def invalidate_cache(cls):
+        _CACHE.clear()
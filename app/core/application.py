@@ -11,38 +11,46 @@ application lifecycle, window management, and core functionality.
 жизненным циклом приложения, управлением окон и основной функциональностью.
 """
 
-import sys
+import os
 import logging
-import traceback
 from pathlib import Path
-from typing import Optional
-from PyQt6.QtWidgets import (
-    QMainWindow, QApplication, QMessageBox, QSystemTrayIcon, 
-    QMenu, QVBoxLayout, QWidget, QSplitter, QStatusBar,
-    QMenuBar, QToolBar, QDockWidget, QTabWidget
-)
-from PyQt6.QtCore import (
-    Qt, QTimer, QThread, pyqtSignal, QSettings, QSize, QPoint,
-    QTranslator, QLocale, QLibraryInfo
-)
-from PyQt6.QtGui import (
-    QIcon, QPixmap, QAction, QKeySequence, QFont, QPalette,
-    QColor, QCloseEvent, QShowEvent, QResizeEvent
-)
+from typing import Optional, TYPE_CHECKING
+from PyQt6.QtWidgets import QMainWindow, QApplication
+from PyQt6.QtCore import QTimer, pyqtSignal, QSettings, QTranslator
+
+if TYPE_CHECKING:
+    from PyQt6.QtGui import QCloseEvent, QShowEvent, QResizeEvent
 
 # Import application modules
 from app.core.config import ConfigManager
 from app.database.connection import DatabaseManager
-from app.ui.main_window import MainWindow
 from app.ui.login_window import LoginWindow
 from app.ui.splash_screen import SplashScreen
 from app.utils.theme_manager import ThemeManager
-from app.utils.notification_manager import NotificationManager
 from app.utils.session_manager import SessionManager
 from app.services.user_service import UserService
-from app.services.project_service import ProjectService
-from app.services.task_service import TaskService
-from app.services.report_service import ReportService
+
+log = logging.getLogger(__name__)
+
+# Resource files keyed by path relative to the resources directory,
+# populated by a single directory scan on first use
+# Файлы ресурсов по пути относительно каталога ресурсов,
+# заполняются одним сканированием каталога при первом обращении
+_RESOURCES: Optional[dict[str, Path]] = None
+
+
+def _scan_resources() -> dict[str, Path]:
+    """
+    Scan the resources directory once and cache the result
+    Однократное сканирование каталога ресурсов с кэшированием результата
+    """
+    global _RESOURCES
+    root = Path("resources")
+    _RESOURCES = {
+        p.relative_to(root).as_posix(): p
+        for p in root.rglob("*") if p.is_file()
+    }
+    return _RESOURCES
 
 
 class ProjectManagerApp(QMainWindow):
@@ -57,6 +65,16 @@ class ProjectManagerApp(QMainWindow):
     theme_changed = pyqtSignal(str)      # Emitted when theme changes
     language_changed = pyqtSignal(str)   # Emitted when language changes
     
+    # Tray menu entries: (label, slot name); None inserts a separator
+    _TRAY_SPEC = (
+        ("Показать", "show_main_window"),
+        None,
+        ("Новый проект", "show_new_project_dialog"),
+        ("Новая задача", "show_new_task_dialog"),
+        None,
+        ("Выход", "quit_application"),
+    )
+    
     def __init__(self, config_manager: ConfigManager, db_manager: DatabaseManager):
         """
         Initialize the main application
@@ -67,6 +85,7 @@ class ProjectManagerApp(QMainWindow):
         # Core managers
         self.config_manager = config_manager
         self.db_manager = db_manager
+        self.cfg_view = config_manager.snapshot()
         
         # UI components
         self.main_window = None
@@ -87,7 +106,30 @@ class ProjectManagerApp(QMainWindow):
         self.current_user = None
         self.is_initialized = False
         self.auto_save_timer = None
-        self.translator = QTranslator()
+        self.translator = None  # Currently installed translator
+        self._translators: dict[str, QTranslator] = {}
+        self._catalog: dict[str, str] | None = None
+        self._post_login_ready = False
+        
+        # Connected (object, signal name, slot) triples, disconnected in cleanup
+        self._wires = []
+        
+        # Single QSettings backend for window state
+        self._qsettings = QSettings()
+        
+        # Cached application instance and primary screen geometry
+        self._qapp = QApplication.instance()
+        self._primary_screen_geom = None
+        for signal in (self._qapp.screenAdded, self._qapp.screenRemoved,
+                       self._qapp.primaryScreenChanged):
+            signal.connect(self._refresh_screen_geom)
+        
+        # Debounce geometry persistence while the window is being resized
+        self._pending_geometry = None
+        self._resize_flush = QTimer(self)
+        self._resize_flush.setSingleShot(True)
+        self._resize_flush.setInterval(250)
+        self._resize_flush.timeout.connect(self._flush_geometry)
         
         # Setup application
         self.setup_application()
@@ -98,53 +140,92 @@ class ProjectManagerApp(QMainWindow):
         Настройка основных компонентов приложения
         """
         try:
-            # Setup basic window properties
-            self.setWindowTitle("Project Management System - Система управления проектами")
-            self.setMinimumSize(1200, 800)
-            
-            # Load application icon
-            self.setup_application_icon()
-            
-            # Initialize managers
-            self.setup_managers()
-            
-            # Initialize services
-            self.setup_services()
-            
-            # Setup UI components
-            self.setup_ui_components()
-            
-            # Setup system tray
-            self.setup_system_tray()
-            
-            # Setup auto-save
-            self.setup_auto_save()
-            
-            # Setup signal connections
-            self.setup_signal_connections()
-            
-            # Apply theme and localization
-            self.apply_theme()
-            self.apply_localization()
-            
-            # Restore window state
-            self.restore_window_state()
+            # Only what the login screen needs; the rest is built after login
+            self._setup_minimum()
             
             self.is_initialized = True
-            logging.info("Application initialized successfully")
+            log.info("Application initialized successfully")
             
-        except Exception as e:
-            logging.error(f"Failed to setup application: {e}")
-            logging.error(traceback.format_exc())
+        except Exception:
+            log.exception("Failed to setup application")
             raise
             
+    def _setup_minimum(self):
+        """
+        Setup components required before the user logs in
+        Настройка компонентов, необходимых до входа пользователя
+        """
+        # Setup basic window properties
+        self.setWindowTitle("Project Management System - Система управления проектами")
+        self.setMinimumSize(1200, 800)
+        
+        # Load application icon
+        self.setup_application_icon()
+        
+        # Show splash screen while the rest is loading
+        if self.cfg_view.ui.show_splash_screen:
+            self.splash_screen = SplashScreen()
+            self.splash_screen.show()
+        
+        # Initialize managers
+        self.setup_managers()
+        
+        # Initialize services
+        self.setup_services()
+        
+        # Setup UI components
+        self.setup_ui_components()
+        
+        # Setup auto-save
+        self.setup_auto_save()
+        
+        # Setup signal connections
+        self.setup_signal_connections()
+        
+        # Apply theme and localization
+        self.apply_theme()
+        self.apply_localization()
+        
+        # Restore window state
+        self.restore_window_state()
+        
+        if self.splash_screen:
+            self.splash_screen.finish(self)
+            
+    def _setup_post_login(self):
+        """
+        Setup components that are only needed after login
+        Настройка компонентов, необходимых только после входа
+        """
+        if self._post_login_ready:
+            return
+            
+        from app.utils.notification_manager import NotificationManager
+        from app.services.project_service import ProjectService
+        from app.services.task_service import TaskService
+        from app.services.report_service import ReportService
+        
+        self.notification_manager = NotificationManager(self.config_manager)
+        
+        self.project_service = ProjectService(self.db_manager)
+        self.task_service = TaskService(self.db_manager)
+        self.report_service = ReportService(self.db_manager)
+        
+        # Build the tray once the event loop is free
+        QTimer.singleShot(0, self.setup_system_tray)
+        
+        self._post_login_ready = True
+        
     def setup_application_icon(self):
         """
         Setup application icon
         Настройка иконки приложения
         """
-        icon_path = Path("resources/icons/app_icon.ico")
-        if icon_path.exists():
+        from PyQt6.QtGui import QIcon, QPixmap, QColor
+        
+        resources = _RESOURCES if _RESOURCES is not None else _scan_resources()
+        icon_path = resources.get("icons/app_icon.ico")
+        if icon_path is not None:
             self.setWindowIcon(QIcon(str(icon_path)))
         else:
             # Create a default icon if none exists
@@ -158,7 +239,6 @@ class ProjectManagerApp(QMainWindow):
         Инициализация всех компонентов менеджеров
         """
         self.theme_manager = ThemeManager(self.config_manager)
-        self.notification_manager = NotificationManager(self.config_manager)
         self.session_manager = SessionManager(self.config_manager, self.db_manager)
         
     def setup_services(self):
@@ -166,17 +246,41 @@ class ProjectManagerApp(QMainWindow):
         Initialize all service components
         Инициализация всех компонентов сервисов
         """
+        self.setup_password_hashing()
         self.user_service = UserService(self.db_manager)
-        self.project_service = ProjectService(self.db_manager)
-        self.task_service = TaskService(self.db_manager)
-        self.report_service = ReportService(self.db_manager)
+        
+    def setup_password_hashing(self):
+        """
+        Apply bcrypt cost, calibrating it once on first start
+        Применение стоимости bcrypt с однократной калибровкой при первом запуске
+        """
+        from app.utils.security import calibrate_bcrypt_cost, set_bcrypt_rounds
+        
+        security = self.config_manager.security_config
+        if not security.bcrypt_rounds:
+            rounds = calibrate_bcrypt_cost(security.bcrypt_target_ms)
+            self.config_manager.set_setting("security", "bcrypt_rounds", rounds)
+        set_bcrypt_rounds(security.bcrypt_rounds)
         
     def setup_ui_components(self):
         """
         Setup main UI components
         Настройка основных компонентов UI
         """
-        # Create main window
+        # Create login window (main window is created on first show)
+        self.login_window = LoginWindow(
+            self.config_manager,
+            self.user_service,
+            self.session_manager
+        )
+        
+    def _create_main_window(self):
+        """
+        Create the main window on first use
+        Создание главного окна при первом обращении
+        """
+        from app.ui.main_window import MainWindow
+        
         self.main_window = MainWindow(
             self.config_manager,
             self.db_manager,
@@ -186,49 +290,35 @@ class ProjectManagerApp(QMainWindow):
             self.report_service
         )
         
-        # Create login window
-        self.login_window = LoginWindow(
-            self.config_manager,
-            self.user_service,
-            self.session_manager
-        )
-        
         # Set main window as central widget
         self.setCentralWidget(self.main_window)
         
-        # Hide main window initially (show after login)
-        self.main_window.hide()
+        # Connect main window signals
+        self._connect_wires([
+            (self.main_window, "logout_requested", self.on_user_logout),
+            (self.main_window, "theme_change_requested", self.change_theme),
+            (self.main_window, "language_change_requested", self.change_language),
+        ])
         
     def setup_system_tray(self):
         """
         Setup system tray functionality
         Настройка функциональности системного трея
         """
+        from PyQt6.QtWidgets import QSystemTrayIcon, QMenu
+        
         if QSystemTrayIcon.isSystemTrayAvailable():
             self.system_tray = QSystemTrayIcon(self)
             self.system_tray.setIcon(self.windowIcon())
             
-            # Create tray menu
-            tray_menu = QMenu()
-            
-            # Show/Hide action
-            show_action = tray_menu.addAction("Показать")
-            show_action.triggered.connect(self.show_main_window)
-            
-            tray_menu.addSeparator()
-            
-            # Quick actions
-            new_project_action = tray_menu.addAction("Новый проект")
-            new_project_action.triggered.connect(self.show_new_project_dialog)
-            
-            new_task_action = tray_menu.addAction("Новая задача")
-            new_task_action.triggered.connect(self.show_new_task_dialog)
-            
-            tray_menu.addSeparator()
-            
-            # Exit action
-            exit_action = tray_menu.addAction("Выход")
-            exit_action.triggered.connect(self.quit_application)
+            # Create tray menu (parented so it outlives this method)
+            tray_menu = QMenu(self)
+            for entry in self._TRAY_SPEC:
+                if entry is None:
+                    tray_menu.addSeparator()
+                else:
+                    label, slot_name = entry
+                    tray_menu.addAction(label).triggered.connect(getattr(self, slot_name))
             
             self.system_tray.setContextMenu(tray_menu)
             self.system_tray.activated.connect(self.tray_icon_activated)
@@ -239,9 +329,7 @@ class ProjectManagerApp(QMainWindow):
         Setup automatic saving functionality
         Настройка функциональности автосохранения
         """
-        auto_save_interval = self.config_manager.get_setting(
-            "ui", "auto_save_interval", 300
-        ) * 1000  # Convert to milliseconds
+        auto_save_interval = self.cfg_view.ui.auto_save_interval * 1000  # Convert to milliseconds
         
         self.auto_save_timer = QTimer()
         self.auto_save_timer.timeout.connect(self.perform_auto_save)
@@ -252,28 +340,42 @@ class ProjectManagerApp(QMainWindow):
         Setup signal connections between components
         Настройка соединений сигналов между компонентами
         """
-        # Connect login window signals
-        if self.login_window:
-            self.login_window.login_successful.connect(self.on_user_logged_in)
-            self.login_window.login_cancelled.connect(self.quit_application)
-            
-        # Connect main window signals
-        if self.main_window:
-            self.main_window.logout_requested.connect(self.on_user_logout)
-            self.main_window.theme_change_requested.connect(self.change_theme)
-            self.main_window.language_change_requested.connect(self.change_language)
-            
-        # Connect session manager signals
-        if self.session_manager:
-            self.session_manager.session_expired.connect(self.on_session_expired)
-            
+        self._connect_wires([
+            (self.login_window, "login_successful", self.on_user_logged_in),
+            (self.login_window, "login_cancelled", self.quit_application),
+            (self.session_manager, "session_expired", self.on_session_expired),
+        ])
+        
+    def _connect_wires(self, wires):
+        """
+        Connect (object, signal name, slot) triples, skipping missing objects
+        Подключение троек (объект, имя сигнала, слот), пропуская отсутствующие объекты
+        """
+        for obj, signal_name, slot in wires:
+            if obj:
+                getattr(obj, signal_name).connect(slot)
+                self._wires.append((obj, signal_name, slot))
+                
+    def _disconnect_wires(self):
+        """
+        Disconnect all signals connected through _connect_wires
+        Отключение всех сигналов, подключенных через _connect_wires
+        """
+        for obj, signal_name, slot in self._wires:
+            try:
+                getattr(obj, signal_name).disconnect(slot)
+            except (TypeError, RuntimeError):
+                pass
+        self._wires.clear()
+        
+
     def apply_theme(self):
         """
         Apply the current theme to the application
         Применение текущей темы к приложению
         """
         if self.theme_manager:
-            current_theme = self.config_manager.get_setting("ui", "theme", "light")
+            current_theme = self.cfg_view.ui.theme
             self.theme_manager.apply_theme(self, current_theme)
             
     def apply_localization(self):
@@ -281,23 +383,62 @@ class ProjectManagerApp(QMainWindow):
         Apply localization settings
         Применение настроек локализации
         """
-        language = self.config_manager.get_setting("ui", "language", "ru")
+        language = self.cfg_view.ui.language
         
-        # Load translation file
-        translation_file = f"translations/{language}.qm"
-        if Path(translation_file).exists():
-            if self.translator.load(translation_file):
-                QApplication.instance().installTranslator(self.translator)
-                
+        # Scan available translation files once per process
+        if self._catalog is None:
+            self._catalog = self._scan_translations()
+            
+        translation_file = self._catalog.get(language)
+        if translation_file is None:
+            return
+            
+        # Load each translation file only once and swap installed translators
+        translator = self._translators.get(language)
+        if translator is None:
+            translator = QTranslator()
+            if not translator.load(translation_file):
+                return
+            self._translators[language] = translator
+            
+        if translator is self.translator:
+            return
+            
+        if self.translator is not None:
+            self._qapp.removeTranslator(self.translator)
+        self._qapp.installTranslator(translator)
+        self.translator = translator
+        
+    @staticmethod
+    def _scan_translations() -> dict[str, str]:
+        """
+        Build a language -> .qm file map from the translations directory
+        Построение карты язык -> файл .qm из каталога переводов
+        """
+        try:
+            with os.scandir("translations") as entries:
+                return {
+                    Path(entry.name).stem: entry.path
+                    for entry in entries
+                    if entry.name.endswith(".qm") and entry.is_file()
+                }
+        except FileNotFoundError:
+            return {}
+            
+
     def restore_window_state(self):
         """
         Restore window geometry and state from settings
         Восстановление геометрии и состояния окна из настроек
         """
-        settings = QSettings()
+        settings = self._qsettings
+        settings.beginGroup("window")
+        geometry, window_state = (
+            settings.value(key) for key in ("geometry", "windowState")
+        )
+        settings.endGroup()
         
         # Restore geometry
-        geometry = settings.value("geometry")
         if geometry:
             self.restoreGeometry(geometry)
         else:
@@ -305,7 +446,6 @@ class ProjectManagerApp(QMainWindow):
             self.center_on_screen()
             
         # Restore window state
-        window_state = settings.value("windowState")
         if window_state:
             self.restoreState(window_state)
             
@@ -314,7 +454,9 @@ class ProjectManagerApp(QMainWindow):
         Center the window on the screen
         Центрирование окна на экране
         """
-        screen = QApplication.primaryScreen().geometry()
+        if self._primary_screen_geom is None:
+            self._refresh_screen_geom()
+        screen = self._primary_screen_geom
         window = self.geometry()
         
         x = (screen.width() - window.width()) // 2
@@ -322,6 +464,13 @@ class ProjectManagerApp(QMainWindow):
         
         self.move(x, y)
         
+    def _refresh_screen_geom(self, *args):
+        """
+        Re-read primary screen geometry after screen configuration changes
+        Обновление геометрии основного экрана после изменения конфигурации экранов
+        """
+        self._primary_screen_geom = self._qapp.primaryScreen().geometry()
+        
     def show_login_window(self):
         """
         Show the login window
@@ -337,12 +486,14 @@ class ProjectManagerApp(QMainWindow):
         Show the main application window
         Показать главное окно приложения
         """
+        if self.main_window is None:
+            self._create_main_window()
+            
         self.show()
         self.raise_()
         self.activateWindow()
         
-        if self.main_window:
-            self.main_window.show()
+        self.main_window.show()
             
     def hide_main_window(self):
         """
@@ -356,6 +507,7 @@ class ProjectManagerApp(QMainWindow):
         Handle successful user login
         Обработка успешного входа пользователя
         """
+        self._setup_post_login()
         self.current_user = user
         
         # Hide login window
@@ -383,7 +535,7 @@ class ProjectManagerApp(QMainWindow):
         # Emit signal
         self.user_logged_in.emit(user)
         
-        logging.info(f"User {user.username} logged in successfully")
+        log.info(f"User {user.username} logged in successfully")
         
     def on_user_logout(self):
         """
@@ -391,7 +543,7 @@ class ProjectManagerApp(QMainWindow):
         Обработка выхода пользователя
         """
         if self.current_user:
-            logging.info(f"User {self.current_user.username} logging out")
+            log.info(f"User {self.current_user.username} logging out")
             
         # End session
         if self.session_manager:
@@ -436,6 +588,7 @@ class ProjectManagerApp(QMainWindow):
             self.theme_manager.apply_theme(self, theme_name)
             self.config_manager.set_setting("ui", "theme", theme_name)
             self.config_manager.save_config()
+            self.cfg_view = self.config_manager.snapshot()
             self.theme_changed.emit(theme_name)
             
     def change_language(self, language: str):
@@ -445,6 +598,7 @@ class ProjectManagerApp(QMainWindow):
         """
         self.config_manager.set_setting("ui", "language", language)
         self.config_manager.save_config()
+        self.cfg_view = self.config_manager.snapshot()
         self.apply_localization()
         self.language_changed.emit(language)
         
@@ -471,6 +625,8 @@ class ProjectManagerApp(QMainWindow):
         Handle system tray icon activation
         Обработка активации иконки системного трея
         """
+        from PyQt6.QtWidgets import QSystemTrayIcon
+        
         if reason == QSystemTrayIcon.ActivationReason.DoubleClick:
             if self.isVisible():
                 self.hide_main_window()
@@ -482,26 +638,29 @@ class ProjectManagerApp(QMainWindow):
         Perform automatic save of application data
         Выполнение автоматического сохранения данных приложения
         """
+        # No view keeps unsaved data of its own, only configuration needs saving here
+        if not self.config_manager.is_dirty:
+            return
+            
         try:
-            if self.main_window and self.current_user:
-                self.main_window.auto_save_data()
-                
-            # Save configuration
             self.config_manager.save_config()
             
-            logging.debug("Auto-save completed successfully")
+            log.debug("Auto-save completed successfully")
             
-        except Exception as e:
-            logging.error(f"Auto-save failed: {e}")
+        except Exception:
+            log.exception("Auto-save failed")
             
     def save_window_state(self):
         """
         Save current window state to settings
         Сохранение текущего состояния окна в настройки
         """
-        settings = QSettings()
+        settings = self._qsettings
+        settings.beginGroup("window")
         settings.setValue("geometry", self.saveGeometry())
         settings.setValue("windowState", self.saveState())
+        settings.endGroup()
+        settings.sync()
         
     def quit_application(self):
         """
@@ -509,7 +668,7 @@ class ProjectManagerApp(QMainWindow):
         Корректное завершение работы приложения
         """
         self.cleanup()
-        QApplication.quit()
+        self._qapp.quit()
         
     def cleanup(self):
         """
@@ -519,10 +678,12 @@ class ProjectManagerApp(QMainWindow):
         try:
             # Save window state
             self.save_window_state()
+            self._resize_flush.stop()
+            self._flush_geometry()
             
             # Save configuration
             self.config_manager.save_config()
-            self.config_manager.save_user_preferences()
+            self.config_manager.save_user_preferences(flush=True)
             
             # End current session
             if self.session_manager and self.current_user:
@@ -536,16 +697,19 @@ class ProjectManagerApp(QMainWindow):
             if self.system_tray:
                 self.system_tray.hide()
                 
+            # Disconnect component signals
+            self._disconnect_wires()
+            
             # Close database connections
             if self.db_manager:
                 self.db_manager.close()
                 
-            logging.info("Application cleanup completed")
+            log.info("Application cleanup completed")
             
-        except Exception as e:
-            logging.error(f"Error during cleanup: {e}")
+        except Exception:
+            log.exception("Error during cleanup")
             
-    def closeEvent(self, event: QCloseEvent):
+    def closeEvent(self, event: "QCloseEvent"):
         """
         Handle application close event
         Обработка события закрытия приложения
@@ -565,7 +729,7 @@ class ProjectManagerApp(QMainWindow):
             self.quit_application()
             event.accept()
             
-    def showEvent(self, event: QShowEvent):
+    def showEvent(self, event: "QShowEvent"):
         """
         Handle window show event
         Обработка события показа окна
@@ -576,19 +740,28 @@ class ProjectManagerApp(QMainWindow):
         if not self.current_user and self.is_initialized:
             QTimer.singleShot(100, self.show_login_window)
             
-    def resizeEvent(self, event: QResizeEvent):
+    def resizeEvent(self, event: "QResizeEvent"):
         """
         Handle window resize event
         Обработка события изменения размера окна
         """
         super().resizeEvent(event)
         
-        # Update window geometry in config
+        # Update window geometry in config once resizing settles
         if self.is_initialized:
-            geometry = {
+            self._pending_geometry = {
                 "x": self.x(),
                 "y": self.y(),
                 "width": self.width(),
                 "height": self.height()
             }
-            self.config_manager.ui_config.window_geometry = geometry
+            self._resize_flush.start()
+            
+    def _flush_geometry(self):
+        """
+        Write the last observed window geometry to config
+        Запись последней геометрии окна в конфигурацию
+        """
+        if self._pending_geometry is not None:
+            self.config_manager.set_setting("ui", "window_geometry", self._pending_geometry)
+            self._pending_geometry = None
@@ -17,17 +17,49 @@ This package contains all database-related functionality including:
 - Паттерны репозитория
 """
 
-from app.database.connection import DatabaseManager
-from app.database.models import Base, User, Project, Task, Comment, Attachment
-from app.database.repository import BaseRepository
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from app.database.connection import DatabaseManager
+    from app.database.models import Base, User, Project, Task, Comment, Attachment
+    from app.database.repository import BaseRepository
+
+# Symbols are imported on first access (PEP 562) to keep SQLAlchemy
+# off the package import path
+# Символы импортируются при первом обращении (PEP 562), чтобы не
+# загружать SQLAlchemy при импорте пакета
+_LAZY = {
+    "DatabaseManager": "app.database.connection",
+    "Base": "app.database.models",
+    "User": "app.database.models",
+    "Project": "app.database.models",
+    "Task": "app.database.models",
+    "Comment": "app.database.models",
+    "Attachment": "app.database.models",
+    "BaseRepository": "app.database.repository",
+}
 
 __all__ = [
     "DatabaseManager",
     "Base",
-    "User", 
+    "User",
     "Project",
     "Task",
     "Comment",
     "Attachment",
     "BaseRepository"
 ]
+
+
+def __getattr__(name):
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY))
@@ -12,28 +12,159 @@ database operations for the project management system.
 """
 
 import os
+import time
+import functools
 import logging
 import threading
+import weakref
 from contextlib import contextmanager
+from contextvars import ContextVar
 from pathlib import Path
-from typing import Optional, Generator, Any, Dict
+from collections.abc import Mapping
+from typing import Optional, Generator, Any, Dict, TYPE_CHECKING
 from sqlalchemy import (
     create_engine, Engine, text, inspect, event,
     pool, exc as sqlalchemy_exc
 )
-from sqlalchemy.orm import (
-    sessionmaker, Session, scoped_session,
-    declarative_base
-)
+from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import QueuePool, StaticPool
-from alembic.config import Config as AlembicConfig
-from alembic import command as alembic_command
-from alembic.runtime.migration import MigrationContext
-from alembic.operations import Operations
+from sqlalchemy.util import LRUCache
 
 # Import models after they are defined
 from app.database.models import Base
 from app.core.config import ConfigManager
+from app.db.migrations import SCHEMA_VERSION, create_enum_types, upgrade_schema
+
+if TYPE_CHECKING:
+    # Alembic is imported only when migrations actually run
+    from alembic.config import Config as AlembicConfig
+
+
+# PRAGMAs applied to every new SQLite connection
+# PRAGMA, применяемые к каждому новому подключению SQLite
+SQLITE_PRAGMAS = (
+    "PRAGMA foreign_keys=ON",
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA journal_size_limit=67108864",
+    "PRAGMA wal_autocheckpoint=1000",
+)
+
+# Journal settings only matter for connections that write
+# Настройки журнала важны только для пишущих подключений
+_SQLITE_WRITER_ONLY_PRAGMAS = ("journal_mode", "journal_size_limit", "wal_autocheckpoint")
+
+SQLITE_READ_PRAGMAS = tuple(
+    pragma for pragma in SQLITE_PRAGMAS
+    if not any(name in pragma for name in _SQLITE_WRITER_ONLY_PRAGMAS)
+)
+
+# Bundles joined into scripts once, executed with a single executescript call
+# Наборы, объединенные в скрипты один раз и выполняемые одним executescript
+SQLITE_PRAGMA_SCRIPT = "".join(f"{pragma};\n" for pragma in SQLITE_PRAGMAS)
+SQLITE_READ_PRAGMA_SCRIPT = "".join(f"{pragma};\n" for pragma in SQLITE_READ_PRAGMAS)
+
+# Default time SQLite waits on a locked database before raising SQLITE_BUSY, ms
+# (matches the pysqlite connect timeout, a lower PRAGMA would shorten the wait)
+# Время ожидания SQLite на заблокированной базе до ошибки SQLITE_BUSY, мс
+DEFAULT_BUSY_TIMEOUT_MS = 30000
+
+# Number of pooled read-only SQLite connections
+# Количество пулов подключений SQLite только для чтения
+SQLITE_READ_POOL_SIZE = 4
+
+# Connections opened ahead of time by initialize()
+# Количество подключений, открываемых заранее в initialize()
+WARM_POOL_SIZE = 4
+
+# Minimum interval between PRAGMA optimize runs, seconds
+# Минимальный интервал между запусками PRAGMA optimize, секунды
+OPTIMIZE_INTERVAL_SECONDS = 15 * 60
+
+# Size of the compiled statement cache shared by all engines
+# Размер общего для всех движков кэша скомпилированных запросов
+COMPILED_CACHE_SIZE = 500
+
+# How long table row counts from get_database_info stay cached, seconds
+# Время кэширования количества строк в get_database_info, секунды
+TABLE_STATS_TTL_SECONDS = 60
+
+# Tables reported in get_database_info statistics
+# Таблицы, попадающие в статистику get_database_info
+STATS_TABLES = ('users', 'projects', 'tasks', 'comments', 'attachments')
+
+
+# Hot statements parsed once at import
+# Часто используемые запросы, разбираемые один раз при импорте
+_PRAGMA_OPTIMIZE = text("PRAGMA optimize")
+_USERS_MAX_ROWID = text("SELECT max(rowid) FROM users")
+_COUNT_USERS = text("SELECT COUNT(*) FROM users")
+
+
+@functools.lru_cache(maxsize=256)
+def _compiled(sql: str):
+    """
+    Cached text() clause for an SQL string
+    Кэшированный объект text() для строки SQL
+    """
+    return text(sql)
+
+
+def _apply_sqlite_pragmas(dbapi_connection, connection_record, script):
+    """
+    Apply PRAGMA script once per DBAPI connection
+    Применение скрипта PRAGMA один раз для каждого подключения DBAPI
+    """
+    if connection_record.info.get("initialized"):
+        return
+    dbapi_connection.executescript(script)
+    connection_record.info["initialized"] = True
+
+
+def _dispose_engine(*engines):
+    """
+    Dispose engines left open when a manager is garbage collected
+    Освобождение движков, оставшихся открытыми при сборке мусора
+    """
+    for engine in engines:
+        if engine is not None:
+            engine.dispose()
+
+
+class _DBInfoView(Mapping):
+    """
+    Database info mapping with table statistics computed on first access
+    Информация о базе данных со статистикой таблиц, вычисляемой при обращении
+    """
+    
+    _KEYS = ("url", "initialized", "engine_info", "table_stats")
+    
+    def __init__(self, manager: "DatabaseManager", engine_info: Optional[Dict[str, Any]]):
+        self._manager = manager
+        self._engine_info = engine_info
+        
+    def __getitem__(self, key: str) -> Any:
+        if key == "url":
+            return self._manager._database_url
+        if key == "initialized":
+            return self._manager._initialized
+        if key == "engine_info":
+            return self._engine_info
+        if key == "table_stats":
+            return self._manager._get_table_stats()
+        raise KeyError(key)
+        
+    def __iter__(self):
+        return iter(self._KEYS)
+        
+    def __len__(self) -> int:
+        return len(self._KEYS)
+        
+    def __repr__(self) -> str:
+        return f"_DBInfoView(url={self._manager._database_url!r}, initialized={self._manager._initialized})"
 
 
 class DatabaseManager:
@@ -53,16 +184,47 @@ class DatabaseManager:
         # Database configuration
         self._engine: Optional[Engine] = None
         self._session_factory: Optional[sessionmaker] = None
-        self._scoped_session: Optional[scoped_session] = None
+        self._session_cv: ContextVar[Optional[Session]] = ContextVar("db_session", default=None)
+        
+        # Compiled statement cache shared by the writer and reader engines
+        self._compiled_cache = LRUCache(COMPILED_CACHE_SIZE)
+        
+        # Read-only engine (SQLite only, shares the WAL with the writer)
+        self._read_engine: Optional[Engine] = None
+        self._read_session_factory: Optional[sessionmaker] = None
         
         # Thread safety
         self._lock = threading.RLock()
         self._initialized = False
+        self._finalizer: Optional[weakref.finalize] = None
+        
+        # Table names, read once after schema setup and migrations
+        self._table_names: frozenset = frozenset()
+        
+        # Cached table row counts: (monotonic time, stats)
+        self._table_stats_cache: Optional[tuple] = None
+        
+        # Time of the last PRAGMA optimize run
+        self._last_optimize = time.monotonic()
         
         # Connection settings
+        self._busy_timeout_ms = (
+            self._get_busy_timeout_ms(self.config_manager.db_config)
+            if self.config_manager else DEFAULT_BUSY_TIMEOUT_MS
+        )
         self._database_url = self._get_database_url()
         self._engine_options = self._get_engine_options()
         
+    @staticmethod
+    def _get_busy_timeout_ms(db_config) -> int:
+        """
+        Get SQLite lock wait, never shorter than the connect timeout
+        Время ожидания блокировки SQLite, не меньше таймаута подключения
+        """
+        # pysqlite's "timeout" already sets sqlite3_busy_timeout on the writer connection
+        connect_timeout_ms = db_config.connection_timeout * 1000
+        return max(db_config.busy_timeout_ms or connect_timeout_ms, connect_timeout_ms)
+        
     def _get_database_url(self) -> str:
         """
         Get database URL from configuration
@@ -111,14 +273,24 @@ class DatabaseManager:
             options["echo"] = db_config.echo_sql
             
             if db_config.type == "sqlite":
-                # SQLite-specific options
+                # SQLite-specific options (in-process connection cannot go stale)
                 options.update({
+                    "pool_pre_ping": False,
                     "poolclass": StaticPool,
                     "connect_args": {
                         "check_same_thread": False,
                         "timeout": db_config.connection_timeout
                     }
                 })
+                
+                # WAL allows concurrent readers, so threaded use gets a real pool;
+                # in-memory databases need the single shared connection
+                if db_config.sqlite_pool_threads > 1 and db_config.sqlite_path != ":memory:":
+                    options.update({
+                        "poolclass": QueuePool,
+                        "pool_size": 5,
+                        "max_overflow": 10
+                    })
             elif db_config.type == "postgresql":
                 # PostgreSQL-specific options
                 options.update({
@@ -127,9 +299,19 @@ class DatabaseManager:
                     "max_overflow": 20,
                     "pool_timeout": db_config.connection_timeout
                 })
+                
+                if db_config.pgbouncer_mode:
+                    # Pre-ping leaves PgBouncer server connections idle in transaction;
+                    # recycle below PgBouncer's server_idle_timeout instead
+                    options.update({
+                        "pool_pre_ping": False,
+                        "pool_recycle": 60
+                    })
+                    self.logger.info("PgBouncer mode: pool pre-ping disabled, pool_recycle=60s")
         else:
             # Default SQLite options
             options.update({
+                "pool_pre_ping": False,
                 "poolclass": StaticPool,
                 "connect_args": {
                     "check_same_thread": False,
@@ -144,6 +326,10 @@ class DatabaseManager:
         Initialize database connection and create tables
         Инициализация подключения к базе данных и создание таблиц
         """
+        # Unlocked fast path once initialized; rechecked under the lock below
+        if self._initialized:
+            return True
+            
         with self._lock:
             if self._initialized:
                 return True
@@ -152,6 +338,7 @@ class DatabaseManager:
                 # Create engine
                 self._engine = create_engine(
                     self._database_url,
+                    execution_options={"compiled_cache": self._compiled_cache},
                     **self._engine_options
                 )
                 
@@ -167,15 +354,23 @@ class DatabaseManager:
                     expire_on_commit=False
                 )
                 
-                # Create scoped session
-                self._scoped_session = scoped_session(self._session_factory)
-                
-                # Create tables if they don't exist
+                # Create tables if they don't exist (also caches table names)
                 self._create_tables()
                 
                 # Run migrations
                 self._run_migrations()
                 
+                # Create read-only engine once the database file exists
+                self._setup_read_engine()
+                
+                # Open pooled connections up front
+                self._warm_pools()
+                
+                # Dispose engines if the manager is collected without close()
+                self._finalizer = weakref.finalize(
+                    self, _dispose_engine, self._engine, self._read_engine
+                )
+                
                 self._initialized = True
                 self.logger.info(f"Database initialized successfully: {self._database_url}")
                 return True
@@ -191,16 +386,69 @@ class DatabaseManager:
         Настройка слушателей событий SQLAlchemy
         """
         if self._database_url.startswith("sqlite"):
+            script = SQLITE_PRAGMA_SCRIPT + f"PRAGMA busy_timeout={self._busy_timeout_ms};\n"
+            
             # Enable foreign key constraints for SQLite
             @event.listens_for(self._engine, "connect")
             def set_sqlite_pragma(dbapi_connection, connection_record):
-                cursor = dbapi_connection.cursor()
-                cursor.execute("PRAGMA foreign_keys=ON")
-                cursor.execute("PRAGMA journal_mode=WAL")
-                cursor.execute("PRAGMA synchronous=NORMAL")
-                cursor.execute("PRAGMA cache_size=10000")
-                cursor.execute("PRAGMA temp_store=MEMORY")
-                cursor.close()
+                _apply_sqlite_pragmas(dbapi_connection, connection_record, script)
+                
+    def _setup_read_engine(self):
+        """
+        Create a pooled read-only engine for SQLite
+        Создание пула подключений SQLite только для чтения
+        """
+        if not self._database_url.startswith("sqlite") or ":memory:" in self._database_url:
+            return
+            
+        db_file = Path(self._database_url.replace("sqlite:///", ""))
+        self._read_engine = create_engine(
+            f"sqlite:///file:{db_file.as_posix()}?mode=ro&uri=true",
+            echo=self._engine_options.get("echo", False),
+            poolclass=QueuePool,
+            pool_size=SQLITE_READ_POOL_SIZE,
+            max_overflow=0,
+            connect_args={"check_same_thread": False},
+            execution_options={"compiled_cache": self._compiled_cache}
+        )
+        
+        script = SQLITE_READ_PRAGMA_SCRIPT + f"PRAGMA busy_timeout={self._busy_timeout_ms};\n"
+        
+        @event.listens_for(self._read_engine, "connect")
+        def set_sqlite_read_pragma(dbapi_connection, connection_record):
+            _apply_sqlite_pragmas(dbapi_connection, connection_record, script)
+            
+        self._read_session_factory = sessionmaker(
+            bind=self._read_engine,
+            expire_on_commit=False
+        )
+                
+    def _warm_pools(self):
+        """
+        Fill connection pools so first queries skip connect and PRAGMA setup
+        Заполнение пулов подключений, чтобы первые запросы не ждали подключения
+        """
+        try:
+            if self._read_engine is not None:
+                self._warm_pool(self._read_engine, SQLITE_READ_POOL_SIZE)
+            if isinstance(self._engine.pool, QueuePool):
+                self._warm_pool(self._engine, min(WARM_POOL_SIZE, self._engine.pool.size()))
+        except Exception as e:
+            self.logger.warning(f"Connection pool warmup failed: {e}")
+            
+    @staticmethod
+    def _warm_pool(engine: Engine, size: int):
+        """
+        Check out and return connections so the pool keeps them open
+        Получение и возврат подключений, чтобы пул держал их открытыми
+        """
+        connections = []
+        try:
+            for _ in range(size):
+                connections.append(engine.connect())
+        finally:
+            for conn in connections:
+                conn.close()
                 
     def _test_connection(self):
         """
@@ -208,8 +456,8 @@ class DatabaseManager:
         Тестирование подключения к базе данных
         """
         try:
-            with self._engine.connect() as conn:
-                conn.execute(text("SELECT 1"))
+            with self._engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+                conn.exec_driver_sql("SELECT 1")
                 self.logger.debug("Database connection test successful")
         except Exception as e:
             self.logger.error(f"Database connection test failed: {e}")
@@ -220,13 +468,93 @@ class DatabaseManager:
         Create database tables if they don't exist
         Создание таблиц базы данных, если они не существуют
         """
+        # One introspection query instead of an existence check per table
+        existing = set(inspect(self._engine).get_table_names())
+        self._table_names = frozenset(existing)
+        
+        # A database already under Alembic control is brought up to date by migrations
+        revision = self._get_alembic_revision() if "alembic_version" in existing else None
+        if revision is not None:
+            self.logger.debug(f"Database at Alembic revision {revision}, skipping create_all")
+            return
+            
+        to_create = [table for table in Base.metadata.sorted_tables if table.name not in existing]
+        is_sqlite = self._database_url.startswith("sqlite")
         try:
-            Base.metadata.create_all(self._engine)
-            self.logger.info("Database tables created successfully")
+            with self._engine.begin() as conn:
+                # Databases from earlier releases are upgraded in place before any new DDL
+                if existing and self._schema_outdated(conn):
+                    upgrade_schema(conn)
+                    
+                create_enum_types(conn)
+                if to_create:
+                    # checkfirst stays on: it also guards schema-level types such as PostgreSQL ENUMs
+                    Base.metadata.create_all(conn, tables=to_create)
+                    
+                if is_sqlite:
+                    conn.exec_driver_sql(f"PRAGMA user_version = {SCHEMA_VERSION}")
         except Exception as e:
             self.logger.error(f"Failed to create database tables: {e}")
             raise
             
+        if to_create:
+            self.logger.info("Database tables created successfully")
+            existing.update(table.name for table in to_create)
+            
+        # Mark the fresh schema as current so later starts skip create_all
+        if Path("alembic").exists():
+            try:
+                from alembic import command as alembic_command
+                alembic_command.stamp(self._get_alembic_config(), "head")
+                existing.add("alembic_version")
+            except Exception as e:
+                self.logger.warning(f"Failed to stamp Alembic revision: {e}")
+                
+        self._table_names = frozenset(existing)
+                
+    def _schema_outdated(self, conn) -> bool:
+        """
+        Check whether the upgrade steps need to run
+        Проверка необходимости обновления схемы
+        """
+        # SQLite records the schema version; elsewhere the steps are cheap catalog checks
+        if not self._database_url.startswith("sqlite"):
+            return True
+        return conn.exec_driver_sql("PRAGMA user_version").scalar() != SCHEMA_VERSION
+        
+    def _get_alembic_revision(self) -> Optional[str]:
+        """
+        Get the current Alembic revision of the database
+        Получение текущей ревизии Alembic базы данных
+        """
+        try:
+            from alembic.runtime.migration import MigrationContext
+            with self._engine.connect() as conn:
+                return MigrationContext.configure(conn).get_current_revision()
+        except Exception as e:
+            self.logger.debug(f"Could not read Alembic revision: {e}")
+            return None
+            
+    def _get_alembic_config(self) -> Optional["AlembicConfig"]:
+        """
+        Get Alembic configuration, or None if Alembic is not initialized
+        Получение конфигурации Alembic или None, если Alembic не инициализирован
+        """
+        if not Path("alembic").exists():
+            return None
+            
+        from alembic.config import Config as AlembicConfig
+        alembic_cfg = AlembicConfig("alembic.ini")
+        alembic_cfg.set_main_option("sqlalchemy.url", self._database_url)
+        return alembic_cfg
+            
+    def _refresh_table_names(self):
+        """
+        Cache the list of existing tables
+        Кэширование списка существующих таблиц
+        """
+        self._table_names = frozenset(inspect(self._engine).get_table_names())
+        
     def _run_migrations(self):
         """
         Run database migrations using Alembic
@@ -234,17 +562,15 @@ class DatabaseManager:
         """
         try:
             # Check if Alembic is initialized
-            alembic_dir = Path("alembic")
-            if not alembic_dir.exists():
+            alembic_cfg = self._get_alembic_config()
+            if alembic_cfg is None:
                 self.logger.info("Alembic not initialized, skipping migrations")
                 return
                 
-            # Load Alembic configuration
-            alembic_cfg = AlembicConfig("alembic.ini")
-            alembic_cfg.set_main_option("sqlalchemy.url", self._database_url)
-            
             # Run migrations to head
+            from alembic import command as alembic_command
             alembic_command.upgrade(alembic_cfg, "head")
+            self._refresh_table_names()
             self.logger.info("Database migrations completed successfully")
             
         except Exception as e:
@@ -261,15 +587,41 @@ class DatabaseManager:
             
         return self._session_factory()
         
-    def get_scoped_session(self) -> scoped_session:
+    def get_read_session(self) -> Session:
         """
-        Get thread-local scoped session
-        Получение локальной для потока scoped сессии
+        Get a session for read-only queries
+        Получение сессии для запросов только на чтение
         """
         if not self._initialized:
             raise RuntimeError("Database not initialized. Call initialize() first.")
             
-        return self._scoped_session
+        if self._read_session_factory is None:
+            return self._session_factory()
+        return self._read_session_factory()
+        
+    def get_scoped_session(self) -> Session:
+        """
+        Get the session bound to the current thread or asyncio context
+        Получение сессии, привязанной к текущему потоку или контексту asyncio
+        """
+        if not self._initialized:
+            raise RuntimeError("Database not initialized. Call initialize() first.")
+            
+        session = self._session_cv.get()
+        if session is None:
+            session = self._session_factory()
+            self._session_cv.set(session)
+        return session
+        
+    def remove_scoped_session(self):
+        """
+        Close and forget the session of the current context
+        Закрытие и удаление сессии текущего контекста
+        """
+        session = self._session_cv.get()
+        if session is not None:
+            session.close()
+            self._session_cv.set(None)
         
     @contextmanager
     def session_scope(self) -> Generator[Session, None, None]:
@@ -287,13 +639,80 @@ class DatabaseManager:
         finally:
             session.close()
             
-    def execute_raw_sql(self, sql: str, params: Optional[Dict] = None) -> Any:
+        self._maybe_optimize()
+        
+    def _maybe_optimize(self):
+        """
+        Run PRAGMA optimize if the interval has elapsed
+        Запуск PRAGMA optimize, если интервал истек
+        """
+        if time.monotonic() - self._last_optimize >= OPTIMIZE_INTERVAL_SECONDS:
+            self.optimize()
+            self.checkpoint("PASSIVE")
+            
+    def optimize(self):
+        """
+        Let SQLite refresh query planner statistics
+        Обновление статистики планировщика запросов SQLite
+        """
+        self._last_optimize = time.monotonic()
+        if not self._database_url.startswith("sqlite") or self._engine is None:
+            return
+            
+        try:
+            with self._engine.connect() as conn:
+                conn.execute(_PRAGMA_OPTIMIZE)
+                conn.commit()
+        except Exception as e:
+            self.logger.warning(f"PRAGMA optimize failed: {e}")
+            
+    def checkpoint(self, mode: str = "PASSIVE"):
+        """
+        Checkpoint the SQLite WAL to keep the -wal file bounded
+        Контрольная точка WAL SQLite для ограничения размера файла -wal
+        """
+        if mode not in ("PASSIVE", "FULL", "RESTART", "TRUNCATE"):
+            raise ValueError(f"Unknown checkpoint mode: {mode}")
+        if not self._database_url.startswith("sqlite") or self._engine is None:
+            return
+            
+        try:
+            with self._engine.connect() as conn:
+                conn.exec_driver_sql(f"PRAGMA wal_checkpoint({mode})")
+        except Exception as e:
+            self.logger.warning(f"PRAGMA wal_checkpoint({mode}) failed: {e}")
+            
+    @contextmanager
+    def read_session_scope(self) -> Generator[Session, None, None]:
+        """
+        Context manager for read-only database sessions
+        Контекстный менеджер для сессий базы данных только для чтения
+        """
+        session = self.get_read_session()
+        try:
+            yield session
+        finally:
+            session.close()
+            
+    def execute_raw_sql(self, sql: str, params: Optional[Dict] = None, readonly: bool = False) -> Any:
         """
         Execute raw SQL query
         Выполнение прямого SQL запроса
-        """
+        
+        With readonly=True the query runs on an autocommit connection without
+        a session or BEGIN/COMMIT, and the fetched rows are returned.
+        При readonly=True запрос выполняется в режиме autocommit без сессии
+        и BEGIN/COMMIT, возвращаются полученные строки.
+        """
+        if readonly:
+            if not self._initialized:
+                raise RuntimeError("Database not initialized. Call initialize() first.")
+            engine = self._read_engine or self._engine
+            with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+                return conn.execute(_compiled(sql), params or {}).fetchall()
+                
         with self.session_scope() as session:
-            return session.execute(text(sql), params or {})
+            return session.execute(_compiled(sql), params or {})
             
     def verify_integrity(self) -> bool:
         """
@@ -303,23 +722,25 @@ class DatabaseManager:
         try:
             with self.session_scope() as session:
                 # Check if all required tables exist
-                inspector = inspect(self._engine)
-                existing_tables = inspector.get_table_names()
-                
                 required_tables = [
                     'users', 'projects', 'tasks', 'comments', 
                     'attachments', 'activity_logs', 'project_members', 'task_assignees'
                 ]
                 
-                missing_tables = [table for table in required_tables if table not in existing_tables]
+                missing_tables = [table for table in required_tables if table not in self._table_names]
                 
                 if missing_tables:
                     self.logger.error(f"Missing database tables: {missing_tables}")
                     return False
                     
-                # Basic data integrity checks
-                result = session.execute(text("SELECT COUNT(*) FROM users")).scalar()
-                self.logger.debug(f"Users table contains {result} records")
+                # Basic data integrity checks; on SQLite max(rowid) reads one
+                # B-tree edge instead of scanning the table
+                if self._database_url.startswith("sqlite"):
+                    result = session.execute(_USERS_MAX_ROWID).scalar()
+                    self.logger.debug(f"Users table max rowid is {result}")
+                else:
+                    result = session.execute(_COUNT_USERS).scalar()
+                    self.logger.debug(f"Users table contains {result} records")
                 
                 self.logger.info("Database integrity check passed")
                 return True
@@ -347,7 +768,7 @@ class DatabaseManager:
         Backup SQLite database
         Резервное копирование базы данных SQLite
         """
-        import shutil
+        import sqlite3
         from datetime import datetime
         
         # Extract database file path from URL
@@ -363,24 +784,35 @@ class DatabaseManager:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             backup_path = backup_dir / f"database_backup_{timestamp}.db"
             
-        # Copy database file
-        shutil.copy2(db_file, backup_path)
+        # Copy pages through the online backup API so concurrent writes
+        # cannot produce a torn copy of a WAL database
+        raw_conn = self._engine.raw_connection()
+        try:
+            dst = sqlite3.connect(str(backup_path))
+            try:
+                with dst:
+                    raw_conn.driver_connection.backup(dst, pages=1000, sleep=0.001)
+            finally:
+                dst.close()
+        finally:
+            raw_conn.close()
         self.logger.info(f"SQLite database backed up to: {backup_path}")
         return True
         
     def _backup_postgresql(self, backup_path: Optional[Path] = None) -> bool:
         """
-        Backup PostgreSQL database using pg_dump
+        Backup PostgreSQL database using pg_dump (directory format, parallel jobs)
         Резервное копирование базы данных PostgreSQL с использованием pg_dump
         """
         import subprocess
+        from collections import deque
         from datetime import datetime
         
         if backup_path is None:
             backup_dir = Path("backups")
             backup_dir.mkdir(exist_ok=True)
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            backup_path = backup_dir / f"database_backup_{timestamp}.sql"
+            backup_path = backup_dir / f"database_backup_{timestamp}"
             
         try:
             # Extract connection parameters from URL
@@ -392,6 +824,9 @@ class DatabaseManager:
                 "-p", str(db_config.port),
                 "-U", db_config.username,
                 "-d", db_config.database,
+                "-Fd",
+                "-j", str(os.cpu_count() or 4),
+                "-Z", "6",
                 "-f", str(backup_path)
             ]
             
@@ -399,13 +834,24 @@ class DatabaseManager:
             env = os.environ.copy()
             env["PGPASSWORD"] = db_config.password
             
-            result = subprocess.run(cmd, env=env, capture_output=True, text=True)
+            # Stream stderr instead of buffering it; keep the tail for errors
+            stderr_tail = deque(maxlen=20)
+            process = subprocess.Popen(
+                cmd, env=env, stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE, text=True
+            )
+            for line in process.stderr:
+                line = line.rstrip()
+                stderr_tail.append(line)
+                self.logger.debug(f"pg_dump: {line}")
+            returncode = process.wait()
             
-            if result.returncode == 0:
+            if returncode == 0:
                 self.logger.info(f"PostgreSQL database backed up to: {backup_path}")
                 return True
             else:
-                self.logger.error(f"pg_dump failed: {result.stderr}")
+                stderr_text = "\n".join(stderr_tail)
+                self.logger.error(f"pg_dump failed: {stderr_text}")
                 return False
                 
         except FileNotFoundError:
@@ -415,45 +861,73 @@ class DatabaseManager:
             self.logger.error(f"PostgreSQL backup failed: {e}")
             return False
             
-    def get_database_info(self) -> Dict[str, Any]:
+    def get_database_info(self) -> Mapping:
         """
         Get database information and statistics
         Получение информации и статистики базы данных
-        """
-        info = {
-            "url": self._database_url,
-            "initialized": self._initialized,
-            "engine_info": None,
-            "table_stats": {}
-        }
         
-        if not self._initialized:
-            return info
-            
-        try:
-            # Engine information
-            info["engine_info"] = {
+        Table statistics are counted only when "table_stats" is read and are
+        cached for TABLE_STATS_TTL_SECONDS.
+        Статистика таблиц подсчитывается только при чтении "table_stats"
+        и кэшируется на TABLE_STATS_TTL_SECONDS.
+        """
+        engine_info = None
+        if self._initialized:
+            engine_info = {
                 "driver": self._engine.driver,
                 "dialect": str(self._engine.dialect),
                 "pool_size": getattr(self._engine.pool, 'size', None),
                 "pool_checked_out": getattr(self._engine.pool, 'checkedout', None)
             }
             
-            # Table statistics
+        return _DBInfoView(self, engine_info)
+        
+    def _get_table_stats(self) -> Dict[str, Any]:
+        """
+        Get table row counts, cached for TABLE_STATS_TTL_SECONDS
+        Получение количества строк в таблицах с кэшированием
+        """
+        if not self._initialized:
+            return {}
+            
+        cached = self._table_stats_cache
+        now = time.monotonic()
+        if cached is not None and now - cached[0] < TABLE_STATS_TTL_SECONDS:
+            return cached[1]
+            
+        try:
             with self.session_scope() as session:
-                tables = ['users', 'projects', 'tasks', 'comments', 'attachments']
-                
-                for table in tables:
-                    try:
-                        result = session.execute(text(f"SELECT COUNT(*) FROM {table}")).scalar()
-                        info["table_stats"][table] = result
-                    except Exception:
-                        info["table_stats"][table] = "Error"
-                        
+                stats = self._count_tables(session, STATS_TABLES)
         except Exception as e:
             self.logger.error(f"Failed to get database info: {e}")
+            return {}
             
-        return info
+        self._table_stats_cache = (now, stats)
+        return stats
+        
+    @staticmethod
+    def _count_tables(session: Session, tables) -> Dict[str, Any]:
+        """
+        Count rows in several tables with one UNION ALL query
+        Подсчет строк в нескольких таблицах одним запросом UNION ALL
+        """
+        sql = " UNION ALL ".join(
+            f"SELECT '{table}' AS table_name, COUNT(*) AS row_count FROM {table}" for table in tables
+        )
+        try:
+            return {row.table_name: row.row_count for row in session.execute(_compiled(sql))}
+        except Exception:
+            session.rollback()
+            
+        # Fall back to per-table counts so one broken table does not hide the rest
+        stats = {}
+        for table in tables:
+            try:
+                stats[table] = session.execute(_compiled(f"SELECT COUNT(*) FROM {table}")).scalar()
+            except Exception:
+                session.rollback()
+                stats[table] = "Error"
+        return stats
         
     def _cleanup(self):
         """
@@ -461,13 +935,20 @@ class DatabaseManager:
         Очистка ресурсов базы данных
         """
         try:
-            if self._scoped_session:
-                self._scoped_session.remove()
-                self._scoped_session = None
+            if self._finalizer:
+                self._finalizer.detach()
+                self._finalizer = None
+                
+            self.remove_scoped_session()
                 
             if self._session_factory:
                 self._session_factory = None
                 
+            self._read_session_factory = None
+            if self._read_engine:
+                self._read_engine.dispose()
+                self._read_engine = None
+                
             if self._engine:
                 self._engine.dispose()
                 self._engine = None
@@ -482,6 +963,8 @@ class DatabaseManager:
         """
         with self._lock:
             if self._initialized:
+                self.optimize()
+                self.checkpoint("TRUNCATE")
                 self._cleanup()
                 self._initialized = False
                 self.logger.info("Database connections closed")
@@ -494,10 +977,3 @@ class DatabaseManager:
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit"""
         self.close()
-        
-    def __del__(self):
-        """Destructor"""
-        try:
-            self.close()
-        except Exception:
-            pass  # Ignore errors during cleanup in destructor
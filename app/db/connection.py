@@ -1,15 +1,39 @@
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import sessionmaker
 from app.models.base import Base
 from app.models.user import User
 from app.models.project import Project
 from app.models.task import Task
+from app.db.migrations import SCHEMA_VERSION, upgrade_schema
+
+# Existing databases below this version run the upgrade steps and re-run DDL
+EXPECTED_SCHEMA_VERSION = SCHEMA_VERSION
 
 class Database:
-    def __init__(self, url: str):
-        self.engine = create_engine(url, future=True)
+    def __init__(self, url: str, pool_size: int = 5, max_overflow: int = 10):
+        opts = {'future': True, 'echo': False, 'query_cache_size': 1200}
+        u = make_url(url)
+        if u.get_backend_name() != 'sqlite':
+            opts.update(pool_size=pool_size, max_overflow=max_overflow, pool_pre_ping=True, pool_recycle=1800)
+        if u.get_driver_name() == 'psycopg':
+            # Server-side prepared statements after 5 executions
+            opts['connect_args'] = {'prepare_threshold': 5}
+        self.engine = create_engine(url, **opts)
         self.Session = sessionmaker(bind=self.engine, future=True)
+        self.is_sqlite = self.engine.dialect.name == 'sqlite'
     def ensure_initialized(self):
-        Base.metadata.create_all(self.engine)
+        if not self.is_sqlite:
+            with self.engine.begin() as conn:
+                upgrade_schema(conn)
+                Base.metadata.create_all(conn)
+            return
+        with self.engine.connect() as conn:
+            if conn.exec_driver_sql('PRAGMA user_version').scalar() == EXPECTED_SCHEMA_VERSION:
+                return
+        with self.engine.begin() as conn:
+            upgrade_schema(conn)
+            Base.metadata.create_all(conn)
+            conn.exec_driver_sql(f'PRAGMA user_version = {EXPECTED_SCHEMA_VERSION}')
     def session(self):
         return self.Session()
@@ -1 +1,155 @@
-# stub
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Schema Upgrades - Обновление схемы
+In-place upgrades for databases created by earlier releases
+"""
+
+from sqlalchemy import Connection, Enum, bindparam, case, column, inspect, table, text, update
+from app.models.base import Base
+
+# Bump together with a new upgrade step; SQLite databases record it in PRAGMA user_version
+SCHEMA_VERSION = 6
+
+# Indexes earlier releases created that duplicate another index
+OBSOLETE_INDEXES = ('ix_attachments_file_hash', 'idx_user_email_active', 'idx_user_username_active')
+
+_LEGACY_PG_TYPES = text("SELECT typname FROM pg_type WHERE typname IN :names").bindparams(
+    bindparam('names', expanding=True)
+)
+
+
+def _enum_columns():
+    """(table name, column name, Enum type) for every enum column in the models"""
+    return [
+        (tbl.name, col.name, col.type)
+        for tbl in Base.metadata.sorted_tables
+        for col in tbl.columns
+        if isinstance(col.type, Enum) and col.type.enum_class is not None
+    ]
+
+
+def _legacy_type_name(enum_type: Enum) -> str:
+    """Name SQLAlchemy gave the type before enums were named explicitly"""
+    return enum_type.enum_class.__name__.lower()
+
+
+def _renamed_members(enum_type: Enum) -> dict:
+    """Stored member name -> member value, for members whose value differs"""
+    return {m.name: m.value for m in enum_type.enum_class if m.name != m.value}
+
+
+def create_enum_types(conn: Connection):
+    """Create the named PostgreSQL ENUM types that don't exist yet"""
+    if conn.dialect.name != 'postgresql':
+        return
+    types = {enum_type.name: enum_type for _, _, enum_type in _enum_columns()}
+    for enum_type in types.values():
+        enum_type.create(conn, checkfirst=True)
+
+
+def migrate_enum_values(conn: Connection, tables: set):
+    """
+    Move enum columns from stored member names ('ACTIVE') to member values ('active')
+    Перевод столбцов перечислений с имен элементов на их значения
+    """
+    if conn.dialect.name == 'postgresql':
+        _migrate_pg_enum_types(conn)
+        return
+
+    touched = set()
+    for table_name, column_name, enum_type in _enum_columns():
+        renames = _renamed_members(enum_type)
+        if table_name not in tables or not renames:
+            continue
+        col = column(column_name)
+        conn.execute(
+            update(table(table_name, col))
+            .where(col.in_(list(renames)))
+            .values({column_name: case(renames, value=col)})
+        )
+        touched.add(table_name)
+
+    # Partial index predicates are stored as literal text, rebuild them with the new values
+    for tbl in Base.metadata.sorted_tables:
+        if tbl.name not in touched:
+            continue
+        for index in tbl.indexes:
+            if index.dialect_options[conn.dialect.name].get('where') is not None:
+                index.drop(conn, checkfirst=True)
+                index.create(conn)
+
+
+def _migrate_pg_enum_types(conn: Connection):
+    """Rename legacy PostgreSQL ENUM types and their labels in place"""
+    types = {}
+    for _, _, enum_type in _enum_columns():
+        legacy = _legacy_type_name(enum_type)
+        if legacy != enum_type.name:
+            types.setdefault(legacy, enum_type)
+    if not types:
+        return
+
+    # Renamed labels keep their OIDs, so stored rows and index predicates follow automatically
+    found = conn.execute(_LEGACY_PG_TYPES, {'names': list(types)}).scalars().all()
+    for legacy in found:
+        enum_type = types[legacy]
+        conn.exec_driver_sql(f'ALTER TYPE {legacy} RENAME TO {enum_type.name}')
+        for name, value in _renamed_members(enum_type).items():
+            conn.exec_driver_sql(f"ALTER TYPE {enum_type.name} RENAME VALUE '{name}' TO '{value}'")
+
+
+def add_full_name_column(conn: Connection, tables: set):
+    """
+    Add the generated users.full_name_cached column to older databases
+    Добавление вычисляемого столбца users.full_name_cached в старые базы данных
+    """
+    if 'users' not in tables:
+        return
+    if any(col['name'] == 'full_name_cached' for col in inspect(conn).get_columns('users')):
+        return
+
+    col = Base.metadata.tables['users'].c.full_name_cached
+    # SQLite's ALTER TABLE can only add VIRTUAL generated columns; reads look the same
+    storage = 'VIRTUAL' if conn.dialect.name == 'sqlite' else 'STORED'
+    conn.exec_driver_sql(
+        f"ALTER TABLE users ADD COLUMN full_name_cached {col.type.compile(conn.dialect)} "
+        f"GENERATED ALWAYS AS ({col.computed.sqltext}) {storage}"
+    )
+
+
+def drop_obsolete_indexes(conn: Connection):
+    """
+    Drop indexes that duplicate another index
+    Удаление дублирующих индексов
+    """
+    for name in OBSOLETE_INDEXES:
+        conn.exec_driver_sql(f'DROP INDEX IF EXISTS {name}')
+
+
+def rebuild_attachment_hash_index(conn: Connection, tables: set):
+    """
+    Widen idx_attachment_hash to the composite (hash, target) index
+    Расширение idx_attachment_hash до составного индекса
+    """
+    if 'attachments' not in tables:
+        return
+    indexes = {ix['name']: ix['column_names'] for ix in inspect(conn).get_indexes('attachments')}
+    index = next(ix for ix in Base.metadata.tables['attachments'].indexes if ix.name == 'idx_attachment_hash')
+    if indexes.get(index.name) != [col.name for col in index.columns]:
+        index.drop(conn, checkfirst=True)
+        index.create(conn)
+
+
+def upgrade_schema(conn: Connection):
+    """
+    Bring an existing database up to SCHEMA_VERSION (every step is idempotent)
+    Обновление существующей базы данных до SCHEMA_VERSION
+    """
+    tables = set(inspect(conn).get_table_names())
+    if not tables:
+        return
+    migrate_enum_values(conn, tables)
+    add_full_name_column(conn, tables)
+    drop_obsolete_indexes(conn)
+    rebuild_attachment_hash_index(conn, tables)
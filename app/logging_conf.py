@@ -1,5 +1,26 @@
-import logging,sys
+import atexit,logging,queue,sys
+from logging.handlers import QueueHandler,QueueListener
+
+_listener=None
+
+def _stop_listener():
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener=None
 
 def configure_logging(cfg):
+    global _listener
     level=getattr(logging,cfg.log_level.upper(),logging.INFO)
-    logging.basicConfig(level=level,format='%(asctime)s %(levelname)s %(name)s: %(message)s',handlers=[logging.StreamHandler(sys.stdout)])
+    # Skip per-record thread/process lookups
+    logging.logThreads=False
+    logging.logProcesses=False
+    logging.logMultiprocessing=False
+    # Callers only enqueue records; a background thread writes them to stdout
+    _stop_listener()
+    q=queue.SimpleQueue()
+    _listener=QueueListener(q,logging.StreamHandler(sys.stdout),respect_handler_level=True)
+    _listener.start()
+    logging.basicConfig(level=level,format='%(asctime)s %(levelname)s %(name)s: %(message)s',handlers=[QueueHandler(q)],force=True)
+
+atexit.register(_stop_listener)
@@ -1 +1,26 @@
-# stub
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Data Models - Модели данных
+Importing the package registers every mapped class on Base
+"""
+
+from .base import Base
+from .user import User, UserRole, UserStatus
+from .task import Task, TaskStatus, TaskPriority, TaskType, task_assignees, task_dependencies
+from .project import Project, ProjectStatus, ProjectPriority, project_members
+from .comment import Comment
+from .attachment import Attachment
+from .activity_log import ActivityLog
+from .notification import UserNotification
+
+__all__ = [
+    "Base",
+    "User", "UserRole", "UserStatus",
+    "Task", "TaskStatus", "TaskPriority", "TaskType", "task_assignees", "task_dependencies",
+    "Project", "ProjectStatus", "ProjectPriority", "project_members",
+    "Comment",
+    "Attachment",
+    "ActivityLog",
+    "UserNotification",
+]
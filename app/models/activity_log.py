@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Activity Log Model - Модель журнала активности
+Audit trail of user actions
+"""
+
+from datetime import datetime
+from sqlalchemy import Integer, String, Text, DateTime, ForeignKey, Index
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.sql import func
+from .base import Base
+
+
+class ActivityLog(Base):
+    """
+    Activity log model for tracking user actions
+    Модель журнала активности для отслеживания действий пользователей
+    """
+    __tablename__ = 'activity_logs'
+    
+    # Primary key
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    
+    # Activity information
+    action: Mapped[str] = mapped_column(String(100))  # create, update, delete, etc.
+    entity_type: Mapped[str] = mapped_column(String(50))  # project, task, user, etc.
+    entity_id: Mapped[int] = mapped_column(Integer)
+    
+    # Details
+    description: Mapped[str | None] = mapped_column(Text, nullable=True)
+    ip_address: Mapped[str | None] = mapped_column(String(45), nullable=True)  # Supports IPv6
+    user_agent: Mapped[str | None] = mapped_column(String(500), nullable=True)
+    
+    # Timestamp
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=func.now())
+    
+    # Foreign key
+    user_id: Mapped[int] = mapped_column(ForeignKey('users.id'))
+    
+    # Relationship
+    user: Mapped["User"] = relationship('User')
+    
+    # Constraints
+    __table_args__ = (
+        Index('idx_activity_user_created', 'user_id', 'created_at'),
+        Index('idx_activity_entity', 'entity_type', 'entity_id'),
+        Index('idx_activity_action_created', 'action', 'created_at'),
+    )
+    
+    def __repr__(self):
+        return f"<ActivityLog(id={self.id}, action='{self.action}', entity_type='{self.entity_type}', user_id={self.user_id})>"
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Attachment Model - Модель вложения
+File attachments with content-addressed storage
+"""
+
+import os
+import hashlib
+from pathlib import Path
+from typing import Optional
+from datetime import datetime
+from sqlalchemy import Integer, String, DateTime, ForeignKey, Index, CheckConstraint, select
+from sqlalchemy.orm import Mapped, mapped_column, relationship, Session
+from sqlalchemy.sql import func
+from .base import Base
+
+
+class Attachment(Base):
+    """
+    File attachment model
+    Модель файловых вложений
+    """
+    __tablename__ = 'attachments'
+    
+    # Primary key
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    
+    # File information
+    filename: Mapped[str] = mapped_column(String(255))
+    original_filename: Mapped[str] = mapped_column(String(255))
+    file_path: Mapped[str] = mapped_column(String(500))
+    file_size: Mapped[int] = mapped_column(Integer)
+    mime_type: Mapped[str] = mapped_column(String(100))
+    
+    # File hash for deduplication
+    file_hash: Mapped[str] = mapped_column(String(64))
+    
+    # Timestamps
+    uploaded_at: Mapped[datetime] = mapped_column(DateTime, default=func.now())
+    
+    # Foreign keys
+    uploaded_by_id: Mapped[int] = mapped_column(ForeignKey('users.id'))
+    task_id: Mapped[int | None] = mapped_column(ForeignKey('tasks.id'), nullable=True)
+    project_id: Mapped[int | None] = mapped_column(ForeignKey('projects.id'), nullable=True)
+    
+    # Relationships
+    uploaded_by: Mapped["User"] = relationship('User', back_populates='attachments')
+    task: Mapped["Task | None"] = relationship('Task', back_populates='attachments')
+    project: Mapped["Project | None"] = relationship('Project', back_populates='attachments')
+    
+    # Constraints
+    __table_args__ = (
+        CheckConstraint('(task_id IS NOT NULL) OR (project_id IS NOT NULL)', 
+                       name='attachment_target_required'),
+        CheckConstraint('file_size > 0', name='file_size_positive'),
+        Index('idx_attachment_task', 'task_id'),
+        Index('idx_attachment_project', 'project_id'),
+        # Serves find_or_create's (hash, target) lookup, and hash-only lookups by prefix
+        Index('idx_attachment_hash', 'file_hash', 'task_id', 'project_id'),
+    )
+    
+    @property
+    def file_size_mb(self) -> float:
+        """
+        Get file size in megabytes
+        Получение размера файла в мегабайтах
+        """
+        return round(self.file_size / (1024 * 1024), 2)
+        
+    @classmethod
+    def find_or_create(cls, session: Session, file_bytes: bytes, original_filename: str,
+                       mime_type: str, uploaded_by_id: int, storage_dir,
+                       task_id: Optional[int] = None, project_id: Optional[int] = None) -> 'Attachment':
+        """
+        Store file content once by SHA-256 and attach it to a task or project
+        Однократное хранение файла по SHA-256 и прикрепление к задаче или проекту
+        
+        Files are stored at <storage_dir>/<hash[:2]>/<hash>; identical content is
+        written only once and an existing attachment on the same target is reused.
+        Файлы хранятся по пути <storage_dir>/<hash[:2]>/<hash>; одинаковое содержимое
+        записывается один раз, существующее вложение той же цели переиспользуется.
+        """
+        file_hash = hashlib.sha256(file_bytes).hexdigest()
+        
+        existing = session.scalar(
+            select(cls)
+            .where(cls.file_hash == file_hash, cls.task_id == task_id, cls.project_id == project_id)
+            .limit(1)
+        )
+        if existing is not None:
+            return existing
+            
+        file_path = session.scalar(select(cls.file_path).where(cls.file_hash == file_hash).limit(1))
+        if file_path is None or not os.path.exists(file_path):
+            path = Path(storage_dir) / file_hash[:2] / file_hash
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix('.tmp')
+            tmp_path.write_bytes(file_bytes)
+            os.replace(tmp_path, path)
+            file_path = str(path)
+            
+        attachment = cls(
+            filename=file_hash,
+            original_filename=original_filename,
+            file_path=file_path,
+            file_size=len(file_bytes),
+            mime_type=mime_type,
+            file_hash=file_hash,
+            uploaded_by_id=uploaded_by_id,
+            task_id=task_id,
+            project_id=project_id
+        )
+        session.add(attachment)
+        return attachment
+        
+    def __repr__(self):
+        target = f"task_id={self.task_id}" if self.task_id else f"project_id={self.project_id}"
+        return f"<Attachment(id={self.id}, filename='{self.filename}', {target})>"
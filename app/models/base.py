@@ -1,3 +1,19 @@
-from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy import Enum, select
+from sqlalchemy.orm import DeclarativeBase, Session
 class Base(DeclarativeBase):
-    pass
+    @classmethod
+    def in_bulk(cls, session: Session, ids) -> dict:
+        """Load objects by primary key with one IN query, keyed by id"""
+        ids = list(ids)
+        if not ids:
+            return {}
+        return {obj.id: obj for obj in session.scalars(select(cls).where(cls.id.in_(ids)))}
+
+
+def enum_type(enum_cls, name: str) -> Enum:
+    """Native ENUM on PostgreSQL storing member values (VARCHAR elsewhere)"""
+    # No CHECK constraint on VARCHAR backends; rows map back to the member singletons by dict lookup
+    return Enum(
+        enum_cls, name=name, native_enum=True, create_constraint=False,
+        values_callable=lambda e: [m.value for m in e]
+    )
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Comment Model - Модель комментария
+Comments on tasks and projects
+"""
+
+from datetime import datetime
+from sqlalchemy import Integer, Text, DateTime, ForeignKey, Index, CheckConstraint
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.sql import func
+from .base import Base
+
+
+class Comment(Base):
+    """
+    Comment model for tasks and projects
+    Модель комментариев для задач и проектов
+    """
+    __tablename__ = 'comments'
+    
+    # Primary key
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    
+    # Content
+    content: Mapped[str] = mapped_column(Text)
+    
+    # Timestamps
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=func.now())
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=func.now(), onupdate=func.now())
+    
+    # Foreign keys
+    author_id: Mapped[int] = mapped_column(ForeignKey('users.id'))
+    task_id: Mapped[int | None] = mapped_column(ForeignKey('tasks.id'), nullable=True)
+    project_id: Mapped[int | None] = mapped_column(ForeignKey('projects.id'), nullable=True)
+    
+    # Relationships
+    author: Mapped["User"] = relationship('User', back_populates='comments', lazy='joined', innerjoin=True)
+    task: Mapped["Task | None"] = relationship('Task', back_populates='comments')
+    project: Mapped["Project | None"] = relationship('Project')
+    
+    # Constraints
+    __table_args__ = (
+        CheckConstraint('(task_id IS NOT NULL) OR (project_id IS NOT NULL)', 
+                       name='comment_target_required'),
+        Index('idx_comment_task_created', 'task_id', 'created_at'),
+        Index('idx_comment_project_created', 'project_id', 'created_at'),
+    )
+    
+    def __repr__(self):
+        target = f"task_id={self.task_id}" if self.task_id else f"project_id={self.project_id}"
+        return f"<Comment(id={self.id}, author_id={self.author_id}, {target})>"
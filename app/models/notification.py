@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Notification Model - Модель уведомления
+Persisted in-app notifications
+"""
+
+from datetime import datetime
+from sqlalchemy import Integer, String, Text, DateTime, ForeignKey, Index, JSON
+from sqlalchemy.orm import Mapped, mapped_column
+from .base import Base
+
+
+class UserNotification(Base):
+    """
+    In-app notification delivered to a user
+    Уведомление пользователя в приложении
+    """
+    __tablename__ = 'notifications'
+
+    # Primary key
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+
+    # Service-level notification id (e.g. task_assigned_<task>_<user>)
+    key: Mapped[str | None] = mapped_column(String(100), nullable=True)
+
+    # Content
+    title: Mapped[str] = mapped_column(String(200), default='')
+    message: Mapped[str] = mapped_column(Text, default='')
+    notification_type: Mapped[str] = mapped_column(String(50))
+    data: Mapped[dict | None] = mapped_column(JSON, nullable=True)
+
+    # Timestamps
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    read_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+
+    # Foreign key
+    user_id: Mapped[int] = mapped_column(ForeignKey('users.id'))
+
+    def __repr__(self):
+        return f"<UserNotification(id={self.id}, user_id={self.user_id}, type='{self.notification_type}')>"
+
+
+# Serves "newest (unread) notifications for a user" as one index range scan
+Index(
+    'idx_notification_user_unread',
+    UserNotification.user_id, UserNotification.read_at, UserNotification.created_at.desc()
+)
+Index('idx_notification_key', UserNotification.key)
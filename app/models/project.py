@@ -5,11 +5,17 @@ Project Model - Модель проекта
 Comprehensive project management with status tracking, budgeting, and team management
 """
 
-from sqlalchemy import Integer, String, Text, DateTime, Boolean, ForeignKey, Enum, Numeric, Date, Table, Column
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import Integer, String, Text, DateTime, Boolean, ForeignKey, Numeric, Date, Table, Column
+from sqlalchemy import CheckConstraint, Index, case, func, inspect, select, text, update
+from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy.orm import Mapped, mapped_column, relationship, object_session, Session
+from sqlalchemy.orm import selectinload, lazyload, load_only
 from datetime import datetime, date
+from functools import cached_property
 import enum
-from .base import Base
+from .base import Base, enum_type
+from .task import Task, TaskStatus
+from .user import UserRole, USER_ROLE_TYPE
 
 
 class ProjectStatus(enum.Enum):
@@ -33,15 +39,19 @@ class ProjectPriority(enum.Enum):
 project_members = Table(
     'project_members',
     Base.metadata,
-    Column('id', Integer, primary_key=True),
-    Column('project_id', Integer, ForeignKey('projects.id')),
-    Column('user_id', Integer, ForeignKey('users.id')),
-    Column('role', String(50), default="member"),
+    Column('project_id', Integer, ForeignKey('projects.id'), primary_key=True),
+    Column('user_id', Integer, ForeignKey('users.id'), primary_key=True),
+    Column('role', USER_ROLE_TYPE, nullable=False, default=UserRole.DEVELOPER),
     Column('joined_at', DateTime, default=datetime.utcnow),
     Column('is_active', Boolean, default=True)
 )
 
 
+def _completed_sum():
+    """SUM expression counting tasks in DONE status"""
+    return func.sum(case((Task.status == TaskStatus.DONE, 1), else_=0))
+
+
 class Project(Base):
     """
     Project model with comprehensive management features
@@ -58,8 +68,8 @@ class Project(Base):
     description: Mapped[str | None] = mapped_column(Text, nullable=True)
 
     # Status and priority
-    status: Mapped[ProjectStatus] = mapped_column(Enum(ProjectStatus), default=ProjectStatus.PLANNING)
-    priority: Mapped[ProjectPriority] = mapped_column(Enum(ProjectPriority), default=ProjectPriority.MEDIUM)
+    status: Mapped[ProjectStatus] = mapped_column(enum_type(ProjectStatus, 'project_status'), default=ProjectStatus.PLANNING)
+    priority: Mapped[ProjectPriority] = mapped_column(enum_type(ProjectPriority, 'project_priority'), default=ProjectPriority.MEDIUM)
 
     # Dates
     start_date: Mapped[date | None] = mapped_column(Date, nullable=True)
@@ -83,25 +93,42 @@ class Project(Base):
     creator_id: Mapped[int] = mapped_column(ForeignKey('users.id'))
 
     # Relationships
-    creator: Mapped["User"] = relationship("User", foreign_keys=[creator_id])
-    members: Mapped[list["User"]] = relationship("User", secondary=project_members, back_populates="projects")
+    creator: Mapped["User"] = relationship("User", back_populates="created_projects", foreign_keys=[creator_id])
+    members: Mapped[list["User"]] = relationship(
+        "User", secondary=project_members, back_populates="projects", lazy="selectin"
+    )
+    # Lazy: Task.project is joined-loaded, so eager tasks here would pull in every sibling task.
+    # List views that iterate tasks add selectinload(Project.tasks) per query.
     tasks: Mapped[list["Task"]] = relationship("Task", back_populates="project", cascade="all, delete-orphan")
+    attachments: Mapped[list["Attachment"]] = relationship("Attachment", back_populates="project")
+
+    __table_args__ = (
+        CheckConstraint('progress >= 0 AND progress <= 100', name='progress_range'),
+        CheckConstraint('budget >= 0', name='budget_positive'),
+        CheckConstraint('start_date <= end_date', name='valid_date_range'),
+        # Partial index: completed and cancelled projects dominate the table over time.
+        # INCLUDE columns let list views be served from the index alone on PostgreSQL.
+        Index('idx_project_status_priority', 'status', 'priority',
+              postgresql_where=text("status IN ('active', 'planning')"),
+              sqlite_where=text("status IN ('active', 'planning')"),
+              postgresql_include=['name', 'progress', 'deadline']),
+        Index('idx_project_creator_status', 'creator_id', 'status'),
+    )
 
     @property
     def is_active(self) -> bool:
         """Check if project is active"""
-        return self.status == ProjectStatus.ACTIVE
+        return self.status is ProjectStatus.ACTIVE
 
     @property
     def is_completed(self) -> bool:
         """Check if project is completed"""
-        return self.status == ProjectStatus.COMPLETED
+        return self.status is ProjectStatus.COMPLETED
 
-    @property
-    def is_overdue(self) -> bool:
+    def is_overdue(self, today: date | None = None) -> bool:
         """Check if project is overdue"""
         if self.deadline and not self.is_completed:
-            return datetime.now().date() > self.deadline
+            return (today or date.today()) > self.deadline
         return False
 
     @property
@@ -118,16 +145,94 @@ class Project(Base):
             return 0.0
         return (float(self.spent) / float(self.budget)) * 100
 
+    @cached_property
+    def member_roles(self) -> dict[int, UserRole]:
+        """Get active member roles keyed by user id, loaded once per instance"""
+        session = object_session(self)
+        if session is None or self.id is None:
+            return {}
+        rows = session.execute(
+            select(project_members.c.user_id, project_members.c.role)
+            .where(project_members.c.project_id == self.id, project_members.c.is_active.is_(True))
+        )
+        return {user_id: role for user_id, role in rows}
+
+    def _task_counts(self) -> tuple[int, int]:
+        """Get (total, completed) task counts, querying only if tasks are not loaded"""
+        session = object_session(self)
+        if session is None or 'tasks' not in inspect(self).unloaded:
+            return len(self.tasks), sum(1 for t in self.tasks if t.status is TaskStatus.DONE)
+
+        total, completed = session.execute(
+            select(func.count(Task.id), _completed_sum()).where(Task.project_id == self.id)
+        ).one()
+        return total, completed or 0
+
+    @hybrid_property
+    def task_count(self) -> int:
+        """Get total number of tasks"""
+        return self._task_counts()[0]
+
+    @task_count.inplace.expression
+    @classmethod
+    def _task_count_expression(cls):
+        return select(func.count(Task.id)).where(Task.project_id == cls.id).scalar_subquery()
+
+    @hybrid_property
+    def completed_task_count(self) -> int:
+        """Get number of completed tasks"""
+        return self._task_counts()[1]
+
+    @completed_task_count.inplace.expression
+    @classmethod
+    def _completed_task_count_expression(cls):
+        return (
+            select(func.count(Task.id))
+            .where(Task.project_id == cls.id, Task.status == TaskStatus.DONE)
+            .scalar_subquery()
+        )
+
     def calculate_progress(self) -> int:
         """Calculate progress based on completed tasks"""
-        if not self.tasks:
-            return 0
-
-        completed_tasks = len([t for t in self.tasks if t.is_completed])
-        total_tasks = len(self.tasks)
-
+        total_tasks, completed_tasks = self._task_counts()
         return int((completed_tasks / total_tasks) * 100) if total_tasks > 0 else 0
 
+    @classmethod
+    def with_progress_stats(cls, session: Session, project_ids) -> list["Project"]:
+        """Load projects with only task statuses, for calculate_progress()"""
+        stmt = (
+            select(cls)
+            .where(cls.id.in_(list(project_ids)))
+            .options(
+                lazyload('*'),
+                selectinload(cls.tasks).options(load_only(Task.status), lazyload('*'))
+            )
+        )
+        return list(session.scalars(stmt))
+
+    @classmethod
+    def bulk_update_progress(cls, session: Session, project_ids) -> dict[int, int]:
+        """Recalculate progress for many projects with one SELECT and one UPDATE"""
+        ids = list(project_ids)
+        if not ids:
+            return {}
+
+        progress = dict.fromkeys(ids, 0)
+        rows = session.execute(
+            select(Task.project_id, func.count(Task.id), _completed_sum())
+            .where(Task.project_id.in_(ids))
+            .group_by(Task.project_id)
+        )
+        for project_id, total, completed in rows:
+            progress[project_id] = int(((completed or 0) / total) * 100) if total else 0
+
+        session.execute(
+            update(cls)
+            .where(cls.id.in_(ids))
+            .values(progress=case(progress, value=cls.id, else_=cls.progress))
+        )
+        return progress
+
     def update_progress(self):
         """Update project progress automatically"""
         self.progress = self.calculate_progress()
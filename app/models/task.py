@@ -5,11 +5,13 @@ Task Model - Модель задачи
 Advanced task management with hierarchy, time tracking, and dependencies
 """
 
-from sqlalchemy import Integer, String, Text, DateTime, Boolean, ForeignKey, Enum, Numeric, Date, Table, Column
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import Integer, String, Text, DateTime, Boolean, ForeignKey, Numeric, Date, Table, Column
+from sqlalchemy import CheckConstraint, Index, select, update, func, case
+from sqlalchemy.orm import Mapped, mapped_column, relationship, Session, aliased, object_session
+from collections import deque
 from datetime import datetime, date
 import enum
-from .base import Base
+from .base import Base, enum_type
 
 
 class TaskStatus(enum.Enum):
@@ -44,9 +46,8 @@ class TaskType(enum.Enum):
 task_assignees = Table(
     'task_assignees',
     Base.metadata,
-    Column('id', Integer, primary_key=True),
-    Column('task_id', Integer, ForeignKey('tasks.id')),
-    Column('user_id', Integer, ForeignKey('users.id')),
+    Column('task_id', Integer, ForeignKey('tasks.id'), primary_key=True),
+    Column('user_id', Integer, ForeignKey('users.id'), primary_key=True),
     Column('assigned_at', DateTime, default=datetime.utcnow),
     Column('is_active', Boolean, default=True)
 )
@@ -78,13 +79,13 @@ class Task(Base):
     description: Mapped[str | None] = mapped_column(Text, nullable=True)
 
     # Classification
-    status: Mapped[TaskStatus] = mapped_column(Enum(TaskStatus), default=TaskStatus.TODO)
-    priority: Mapped[TaskPriority] = mapped_column(Enum(TaskPriority), default=TaskPriority.MEDIUM)
-    task_type: Mapped[TaskType] = mapped_column(Enum(TaskType), default=TaskType.FEATURE)
+    status: Mapped[TaskStatus] = mapped_column(enum_type(TaskStatus, 'task_status'), default=TaskStatus.TODO)
+    priority: Mapped[TaskPriority] = mapped_column(enum_type(TaskPriority, 'task_priority'), default=TaskPriority.MEDIUM)
+    task_type: Mapped[TaskType] = mapped_column(enum_type(TaskType, 'task_type'), default=TaskType.FEATURE)
 
     # Time tracking
-    estimated_hours: Mapped[float | None] = mapped_column(Numeric(8, 2), nullable=True)
-    actual_hours: Mapped[float] = mapped_column(Numeric(8, 2), default=0)
+    estimated_hours: Mapped[float | None] = mapped_column(Numeric(8, 2, asdecimal=False), nullable=True)
+    actual_hours: Mapped[float] = mapped_column(Numeric(8, 2, asdecimal=False), default=0)
     story_points: Mapped[int | None] = mapped_column(Integer, nullable=True)
 
     # Dates
@@ -112,13 +113,21 @@ class Task(Base):
     creator_id: Mapped[int] = mapped_column(ForeignKey('users.id'))
 
     # Relationships
-    project: Mapped["Project"] = relationship("Project", back_populates="tasks")
-    creator: Mapped["User"] = relationship("User", foreign_keys=[creator_id])
-    assignees: Mapped[list["User"]] = relationship("User", secondary=task_assignees)
+    project: Mapped["Project"] = relationship("Project", back_populates="tasks", lazy="joined", innerjoin=True)
+    creator: Mapped["User"] = relationship(
+        "User", back_populates="created_tasks", foreign_keys=[creator_id], lazy="joined", innerjoin=True
+    )
+    assignees: Mapped[list["User"]] = relationship(
+        "User", secondary=task_assignees, back_populates="assigned_tasks", lazy="selectin"
+    )
+    comments: Mapped[list["Comment"]] = relationship(
+        "Comment", back_populates="task", cascade="all, delete-orphan", lazy="selectin"
+    )
+    attachments: Mapped[list["Attachment"]] = relationship("Attachment", back_populates="task")
 
     # Self-referential for subtasks
     parent_task: Mapped["Task"] = relationship("Task", remote_side=[id], back_populates="subtasks")
-    subtasks: Mapped[list["Task"]] = relationship("Task", back_populates="parent_task")
+    subtasks: Mapped[list["Task"]] = relationship("Task", back_populates="parent_task", lazy="selectin")
 
     # Dependencies
     dependencies: Mapped[list["Task"]] = relationship(
@@ -136,16 +145,25 @@ class Task(Base):
         back_populates="dependencies"
     )
 
+    __table_args__ = (
+        CheckConstraint('progress >= 0 AND progress <= 100', name='task_progress_range'),
+        CheckConstraint('estimated_hours >= 0', name='estimated_hours_positive'),
+        CheckConstraint('actual_hours >= 0', name='actual_hours_positive'),
+        Index('idx_task_project_status', 'project_id', 'status',
+              postgresql_include=['title', 'priority', 'due_date', 'progress']),
+        Index('idx_task_creator_status', 'creator_id', 'status'),
+        Index('idx_task_due_date', 'due_date'),
+    )
+
     @property
     def is_completed(self) -> bool:
         """Check if task is completed"""
-        return self.status == TaskStatus.DONE
+        return self.status is TaskStatus.DONE
 
-    @property
-    def is_overdue(self) -> bool:
+    def is_overdue(self, today: date | None = None) -> bool:
         """Check if task is overdue"""
         if self.due_date and not self.is_completed:
-            return datetime.now().date() > self.due_date
+            return (today or date.today()) > self.due_date
         return False
 
     @property
@@ -167,7 +185,7 @@ class Task(Base):
     def time_efficiency(self) -> float | None:
         """Calculate time efficiency (actual vs estimated)"""
         if self.estimated_hours and self.actual_hours > 0:
-            return float(self.estimated_hours) / float(self.actual_hours)
+            return self.estimated_hours / self.actual_hours
         return None
 
     def mark_completed(self):
@@ -176,6 +194,25 @@ class Task(Base):
         self.progress = 100
         self.completed_at = datetime.utcnow()
 
+    @classmethod
+    def bulk_mark_completed(cls, session: Session, task_ids) -> int:
+        """Mark many tasks completed with one UPDATE (loaded Task objects are not synchronized)"""
+        from .project import Project
+
+        ids = list(task_ids)
+        if not ids:
+            return 0
+
+        project_ids = session.scalars(select(cls.project_id).where(cls.id.in_(ids)).distinct()).all()
+        result = session.execute(
+            update(cls)
+            .where(cls.id.in_(ids))
+            .values(status=TaskStatus.DONE, progress=100, completed_at=datetime.utcnow())
+            .execution_options(synchronize_session=False)
+        )
+        Project.bulk_update_progress(session, project_ids)
+        return result.rowcount
+
     def add_dependency(self, task: "Task"):
         """Add task dependency"""
         if task not in self.dependencies:
@@ -186,9 +223,14 @@ class Task(Base):
         if task in self.dependencies:
             self.dependencies.remove(task)
 
-    def can_start(self) -> bool:
-        """Check if task can be started (all dependencies completed)"""
-        return all(dep.is_completed for dep in self.dependencies)
+    def can_start(self, startable: set[int] | None = None) -> bool:
+        """Check if task can be started (pass compute_startable_tasks() result when checking many)"""
+        if startable is not None:
+            return self.id in startable
+        session = object_session(self)
+        if session is None or self.id is None:
+            return all(dep.is_completed for dep in self.dependencies)
+        return self.id in compute_startable_tasks(session, self.project_id, [self.id])
 
     def calculate_subtask_progress(self) -> int:
         """Calculate progress based on subtasks"""
@@ -198,5 +240,63 @@ class Task(Base):
         total_progress = sum(subtask.progress for subtask in self.subtasks)
         return total_progress // len(self.subtasks) if self.subtasks else 0
 
+    def calculate_progress_from_subtasks(self) -> int:
+        """Calculate progress as the share of completed subtasks"""
+        if not self.subtasks:
+            return self.progress
+
+        completed_subtasks = sum(1 for subtask in self.subtasks if subtask.status is TaskStatus.DONE)
+        return int((completed_subtasks / len(self.subtasks)) * 100)
+
     def __repr__(self):
         return f"<Task(id={self.id}, title='{self.title}', status='{self.status.value}')>"
+
+
+def compute_startable_tasks(session: Session, project_id: int, task_ids=None) -> set[int]:
+    """Get ids of project tasks whose dependencies are all completed, in one query"""
+    dep = aliased(Task)
+    blocking = func.sum(case((dep.status != TaskStatus.DONE, 1), else_=0))
+    stmt = (
+        select(Task.id)
+        .outerjoin(task_dependencies, task_dependencies.c.task_id == Task.id)
+        .outerjoin(dep, dep.id == task_dependencies.c.depends_on_id)
+        .where(Task.project_id == project_id)
+        .group_by(Task.id)
+        .having(func.coalesce(blocking, 0) == 0)
+    )
+    if task_ids is not None:
+        stmt = stmt.where(Task.id.in_(list(task_ids)))
+    return set(session.scalars(stmt))
+
+
+def order_tasks_by_dependencies(session: Session, project_id: int) -> list[int]:
+    """Get project task ids in dependency order (Kahn's algorithm)"""
+    task_ids = session.scalars(select(Task.id).where(Task.project_id == project_id)).all()
+    edges = session.execute(
+        select(task_dependencies.c.depends_on_id, task_dependencies.c.task_id)
+        .join(Task, Task.id == task_dependencies.c.task_id)
+        .where(Task.project_id == project_id)
+    ).all()
+
+    indegree: dict[int, int] = dict.fromkeys(task_ids, 0)
+    dependents: dict[int, list[int]] = {}
+    for depends_on_id, task_id in edges:
+        # Dependencies on other projects' tasks don't constrain the order here
+        if depends_on_id not in indegree:
+            continue
+        dependents.setdefault(depends_on_id, []).append(task_id)
+        indegree[task_id] += 1
+
+    queue = deque(task_id for task_id, degree in indegree.items() if degree == 0)
+    order = []
+    while queue:
+        task_id = queue.popleft()
+        order.append(task_id)
+        for dependent_id in dependents.get(task_id, ()):
+            indegree[dependent_id] -= 1
+            if indegree[dependent_id] == 0:
+                queue.append(dependent_id)
+
+    if len(order) != len(indegree):
+        raise ValueError(f"Circular task dependencies in project {project_id}")
+    return order
@@ -5,12 +5,13 @@ User Model - Модель пользователя
 Advanced user management with roles, permissions, and profile data
 """
 
-from sqlalchemy import Integer, String, Text, DateTime, Boolean, ForeignKey, Enum
-from sqlalchemy.orm import Mapped, mapped_column, relationship
-from werkzeug.security import generate_password_hash, check_password_hash
+from sqlalchemy import Integer, String, Text, DateTime, Boolean, ForeignKey, event, CheckConstraint, Computed
+from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
+from app.utils.security import hash_password, verify_password, tokens_equal
 from datetime import datetime
+from functools import cached_property
 import enum
-from .base import Base
+from .base import Base, enum_type
 
 
 class UserRole(enum.Enum):
@@ -22,6 +23,10 @@ class UserRole(enum.Enum):
     VIEWER = "viewer"
 
 
+# Roles allowed to manage projects
+_MANAGER_ROLES = frozenset({UserRole.ADMIN, UserRole.MANAGER})
+
+
 class UserStatus(enum.Enum):
     """User status enumeration"""
     ACTIVE = "active"
@@ -30,6 +35,10 @@ class UserStatus(enum.Enum):
     PENDING = "pending"
 
 
+# Shared by users.role and project_members.role so PostgreSQL gets one type
+USER_ROLE_TYPE = enum_type(UserRole, 'user_role')
+
+
 class User(Base):
     """
     User model with comprehensive profile and security features
@@ -49,9 +58,14 @@ class User(Base):
     first_name: Mapped[str] = mapped_column(String(50))
     last_name: Mapped[str] = mapped_column(String(50))
     middle_name: Mapped[str | None] = mapped_column(String(50), nullable=True)
+    # Full name formatted by the database, arrives ready-made with every SELECT
+    full_name_cached: Mapped[str | None] = mapped_column(
+        String(152),
+        Computed("last_name || ' ' || first_name || COALESCE(' ' || middle_name, '')", persisted=True)
+    )
     phone: Mapped[str | None] = mapped_column(String(20), nullable=True)
     bio: Mapped[str | None] = mapped_column(Text, nullable=True)
-    avatar_path: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    avatar_path: Mapped[str | None] = mapped_column(String(500), nullable=True)  # File path or storage key
 
     # Work information
     position: Mapped[str | None] = mapped_column(String(100), nullable=True)
@@ -59,8 +73,8 @@ class User(Base):
     employee_id: Mapped[str | None] = mapped_column(String(50), nullable=True)
 
     # System fields
-    role: Mapped[UserRole] = mapped_column(Enum(UserRole), default=UserRole.DEVELOPER)
-    status: Mapped[UserStatus] = mapped_column(Enum(UserStatus), default=UserStatus.ACTIVE)
+    role: Mapped[UserRole] = mapped_column(USER_ROLE_TYPE, default=UserRole.DEVELOPER)
+    status: Mapped[UserStatus] = mapped_column(enum_type(UserStatus, 'user_status'), default=UserStatus.ACTIVE)
 
     # Preferences
     language: Mapped[str] = mapped_column(String(10), default="ru")
@@ -74,29 +88,77 @@ class User(Base):
     account_locked_until: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
     password_changed_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
     two_factor_secret: Mapped[str | None] = mapped_column(String(32), nullable=True)
+    is_verified: Mapped[bool] = mapped_column(Boolean, default=False)
+    password_reset_token: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    password_reset_expires: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    email_verification_token: Mapped[str | None] = mapped_column(String(255), nullable=True)
 
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
     updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+    # Relationships
+    created_projects: Mapped[list["Project"]] = relationship(
+        "Project", back_populates="creator", foreign_keys="Project.creator_id"
+    )
+    created_tasks: Mapped[list["Task"]] = relationship(
+        "Task", back_populates="creator", foreign_keys="Task.creator_id"
+    )
+    assigned_tasks: Mapped[list["Task"]] = relationship(
+        "Task", secondary="task_assignees", back_populates="assignees"
+    )
+    # Lazy: with Project.members eager, loading it here would walk the whole membership graph
+    projects: Mapped[list["Project"]] = relationship(
+        "Project", secondary="project_members", back_populates="members"
+    )
+    comments: Mapped[list["Comment"]] = relationship("Comment", back_populates="author")
+    attachments: Mapped[list["Attachment"]] = relationship("Attachment", back_populates="uploaded_by")
+
+    __table_args__ = (
+        CheckConstraint('length(username) >= 3', name='username_min_length'),
+        CheckConstraint('length(password_hash) >= 8', name='password_min_length'),
+    )
+
     def set_password(self, password: str):
         """Set password with secure hashing"""
-        self.password_hash = generate_password_hash(password)
+        self.password_hash = hash_password(password)
         self.password_changed_at = datetime.utcnow()
 
     def check_password(self, password: str) -> bool:
         """Check password against hash"""
-        return check_password_hash(self.password_hash, password)
-
-    @property
+        return verify_password(password, self.password_hash)
+
+    def verify_reset_token(self, token: str) -> bool:
+        """Check password reset token in constant time"""
+        if self.password_reset_expires and self.password_reset_expires < datetime.utcnow():
+            return False
+        return tokens_equal(token, self.password_reset_token)
+
+    def verify_email_token(self, token: str) -> bool:
+        """Check email verification token in constant time"""
+        return tokens_equal(token, self.email_verification_token)
+
+    @validates('first_name', 'last_name', 'middle_name')
+    def _reset_cached_names(self, key, value):
+        """Drop cached name strings when a name part changes"""
+        _drop_cached_names(self)
+        # Stored full name is stale until the row is flushed and reloaded
+        self.__dict__.pop('full_name_cached', None)
+        return value
+
+    @cached_property
     def full_name(self) -> str:
         """Get user's full name"""
+        # Read the loaded value directly so a missing one never triggers a SELECT
+        stored = self.__dict__.get('full_name_cached')
+        if stored:
+            return stored
         parts = [self.last_name, self.first_name]
         if self.middle_name:
             parts.append(self.middle_name)
         return " ".join(filter(None, parts))
 
-    @property
+    @cached_property
     def display_name(self) -> str:
         """Get display name"""
         return f"{self.first_name} {self.last_name}"
@@ -104,12 +166,34 @@ class User(Base):
     @property
     def is_admin(self) -> bool:
         """Check if user is admin"""
-        return self.role == UserRole.ADMIN
+        return self.role is UserRole.ADMIN
+
+    @property
+    def is_manager(self) -> bool:
+        """Check if user is admin or manager"""
+        return self.role in _MANAGER_ROLES
 
     @property
     def is_active(self) -> bool:
         """Check if user is active"""
-        return self.status == UserStatus.ACTIVE
+        return self.status is UserStatus.ACTIVE
+
+    def can_manage_project(self, project: "Project") -> bool:
+        """Check if user can manage a specific project"""
+        if self.is_admin or project.creator_id == self.id:
+            return True
+        return project.member_roles.get(self.id) is UserRole.MANAGER
 
     def __repr__(self):
         return f"<User(id={self.id}, username='{self.username}', role='{self.role.value}')>"
+
+
+@event.listens_for(User, 'expire')
+@event.listens_for(User, 'refresh')
+def _drop_cached_names(target, *args):
+    """Drop cached name strings when a user is expired or reloaded"""
+    # Expiring the last holder of a user fires this for an already collected instance
+    if target is None:
+        return
+    target.__dict__.pop('full_name', None)
+    target.__dict__.pop('display_name', None)
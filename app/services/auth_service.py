@@ -5,14 +5,30 @@ Authentication Service - Сервис аутентификации
 Advanced authentication with session management and security features
 """
 
-import hashlib
-import secrets
-from datetime import datetime, timedelta
+import json
+import time
+from base64 import urlsafe_b64encode
+from secrets import token_bytes
+from datetime import datetime
 from typing import Optional, Dict, Any
 import logging
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, raiseload
 from sqlalchemy import select
-from werkzeug.security import check_password_hash
+from app.utils.security import hash_password, needs_rehash
+
+try:
+    import orjson
+
+    def _dumps(data: Dict[str, Any]) -> bytes:
+        return orjson.dumps(data)
+
+    _loads = orjson.loads
+except ImportError:
+    # orjson is optional, stdlib json keeps sessions working without it
+    def _dumps(data: Dict[str, Any]) -> str:
+        return json.dumps(data, default=str)
+
+    _loads = json.loads
 
 
 class AuthenticationError(Exception):
@@ -20,49 +36,94 @@ class AuthenticationError(Exception):
     pass
 
 
+# Key prefix for sessions kept in Redis
+SESSION_KEY_PREFIX = "sess:"
+
+# Seconds between sweeps of expired in-process sessions
+SESSION_SWEEP_INTERVAL = 60
+
+
 class SessionManager:
     """Manages user sessions and tokens"""
 
-    def __init__(self, config_manager):
+    def __init__(self, config_manager, redis_client=None):
         self.config = config_manager
+        # Shared Redis store (sessions expire by key TTL); per-process dict when not given
+        self.redis = redis_client
         self.active_sessions: Dict[str, Dict[str, Any]] = {}
         self.session_timeout = 3600  # 1 hour default
+        self._last_sweep = time.monotonic()
 
     def create_session(self, user) -> str:
         """Create new user session"""
-        session_token = secrets.token_urlsafe(32)
+        session_token = urlsafe_b64encode(token_bytes(32)).rstrip(b'=').decode('ascii')
 
         session_data = {
             'user_id': user.id,
             'username': user.username,
             'role': user.role.value,
             'created_at': datetime.utcnow(),
-            'last_activity': datetime.utcnow(),
         }
 
-        self.active_sessions[session_token] = session_data
+        if self.redis is not None:
+            self.redis.setex(
+                SESSION_KEY_PREFIX + session_token,
+                self.session_timeout,
+                _dumps(session_data)
+            )
+        else:
+            session_data['expires_at'] = time.monotonic() + self.session_timeout
+            self.active_sessions[session_token] = session_data
         return session_token
 
     def validate_session(self, session_token: str) -> Optional[Dict[str, Any]]:
         """Validate and refresh session"""
+        if self.redis is not None:
+            # Read and slide the TTL in one round trip
+            pipe = self.redis.pipeline()
+            pipe.get(SESSION_KEY_PREFIX + session_token)
+            pipe.expire(SESSION_KEY_PREFIX + session_token, self.session_timeout)
+            raw, _ = pipe.execute()
+            return self._decode_session(raw) if raw else None
+
+        now = time.monotonic()
+        if now - self._last_sweep > SESSION_SWEEP_INTERVAL:
+            self._sweep_expired(now)
+
         session_data = self.active_sessions.get(session_token)
 
         if not session_data:
             return None
 
         # Check if session expired
-        last_activity = session_data['last_activity']
-        if datetime.utcnow() - last_activity > timedelta(seconds=self.session_timeout):
+        if now > session_data['expires_at']:
             self.destroy_session(session_token)
             return None
 
-        # Update last activity
-        session_data['last_activity'] = datetime.utcnow()
+        # Slide the expiry window
+        session_data['expires_at'] = now + self.session_timeout
+        return session_data
+
+    @staticmethod
+    def _decode_session(raw) -> Dict[str, Any]:
+        """Decode a Redis session, restoring created_at to the datetime the dict path keeps"""
+        session_data = _loads(raw)
+        session_data['created_at'] = datetime.fromisoformat(session_data['created_at'])
         return session_data
 
+    def _sweep_expired(self, now: float):
+        """Drop all expired in-process sessions in one pass"""
+        self.active_sessions = {
+            token: data for token, data in self.active_sessions.items()
+            if data['expires_at'] > now
+        }
+        self._last_sweep = now
+
     def destroy_session(self, session_token: str):
         """Destroy user session"""
-        if session_token in self.active_sessions:
+        if self.redis is not None:
+            self.redis.delete(SESSION_KEY_PREFIX + session_token)
+        elif session_token in self.active_sessions:
             del self.active_sessions[session_token]
 
 
@@ -72,10 +133,10 @@ class AuthService:
     Основной сервис аутентификации
     """
 
-    def __init__(self, db_session: Session, config_manager):
+    def __init__(self, db_session: Session, config_manager, redis_client=None):
         self.db = db_session
         self.config = config_manager
-        self.session_manager = SessionManager(config_manager)
+        self.session_manager = SessionManager(config_manager, redis_client)
         self.logger = logging.getLogger(__name__)
 
     def authenticate_user(self, username: str, password: str) -> Dict[str, Any]:
@@ -83,9 +144,9 @@ class AuthService:
         try:
             from app.models.user import User, UserStatus
 
-            # Find user
+            # Find user (login reads only scalar columns, so forbid relationship loads)
             user = self.db.execute(
-                select(User).where(User.username == username)
+                select(User).where(User.username == username).options(raiseload("*"))
             ).scalar_one_or_none()
 
             if not user:
@@ -99,6 +160,10 @@ class AuthService:
             if not user.check_password(password):
                 raise AuthenticationError("Invalid username or password")
 
+            # Upgrade legacy or outdated hashes while the password is at hand
+            if needs_rehash(user.password_hash):
+                user.password_hash = hash_password(password)
+
             # Complete login
             return self._complete_login(user)
 
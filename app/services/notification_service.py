@@ -5,13 +5,55 @@ Notification Service - Сервис уведомлений
 Comprehensive notification system with multiple delivery channels
 """
 
+import heapq
 import logging
 import json
-from datetime import datetime, timedelta
+import string
+import threading
+from collections import defaultdict, deque
+from concurrent.futures import Executor, ThreadPoolExecutor
+from itertools import islice
+from datetime import date, datetime, timedelta
 from typing import List, Dict, Any, Optional
 from enum import Enum
 from dataclasses import dataclass
-from sqlalchemy.orm import Session
+from sqlalchemy import select, update, delete
+from sqlalchemy.orm import Session, raiseload, selectinload
+
+try:
+    import orjson
+except ImportError:
+    # orjson is optional, stdlib json produces the same values
+    orjson = None
+
+# In-app notifications kept per user (oldest are evicted first)
+MAX_IN_APP_NOTIFICATIONS = 100
+
+# Worker threads for SMTP delivery (I/O-bound, shared by all services)
+EMAIL_WORKERS = 8
+_email_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _get_email_executor() -> ThreadPoolExecutor:
+    """Get shared email executor, creating it on first use"""
+    global _email_executor
+    if _email_executor is None:
+        _email_executor = ThreadPoolExecutor(max_workers=EMAIL_WORKERS, thread_name_prefix='notify-email')
+    return _email_executor
+
+
+def _json_default(value):
+    """Serialize values json can't handle natively"""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return str(value)
+
+
+def _json_safe(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert notification data to JSON column values (dates become ISO strings)"""
+    if orjson is not None:
+        return orjson.loads(orjson.dumps(data, default=_json_default, option=orjson.OPT_NON_STR_KEYS))
+    return json.loads(json.dumps(data, default=_json_default))
 
 
 class NotificationType(Enum):
@@ -34,7 +76,7 @@ class NotificationChannel(Enum):
     SLACK = "slack"
 
 
-@dataclass
+@dataclass(slots=True)
 class Notification:
     """Notification data structure"""
     id: Optional[str] = None
@@ -56,6 +98,48 @@ class Notification:
             self.created_at = datetime.utcnow()
 
 
+class NotificationBuffer:
+    """Bounded per-user notification queue that keeps the id index in sync"""
+
+    __slots__ = ("_items", "index")
+
+    def __init__(self, index: Dict[str, Notification], iterable=()):
+        # Wrapped rather than subclassed so no deque mutator can bypass the index
+        self._items: deque = deque(maxlen=MAX_IN_APP_NOTIFICATIONS)
+        self.index = index
+        for notification in iterable:
+            self.append(notification)
+
+    def append(self, notification: Notification):
+        if len(self._items) == self._items.maxlen:
+            self._unindex(self._items[0])
+        self._items.append(notification)
+        if notification.id:
+            self.index[notification.id] = notification
+
+    def evict_older_than(self, cutoff: datetime) -> int:
+        """Drop notifications created at or before cutoff, return how many"""
+        evicted = 0
+        # Appended in time order, so expired notifications sit at the left end
+        while self._items and self._items[0].created_at <= cutoff:
+            self._unindex(self._items.popleft())
+            evicted += 1
+        return evicted
+
+    def _unindex(self, notification: Notification):
+        if notification.id and self.index.get(notification.id) is notification:
+            del self.index[notification.id]
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def __reversed__(self):
+        return reversed(self._items)
+
+
 class EmailSender:
     """Email notification sender"""
 
@@ -74,6 +158,47 @@ class EmailSender:
             self.logger.error(f"Failed to send email to {recipient}: {str(e)}")
             return False
 
+    def send_bulk(self, recipients: List[str], subject: str, body: str) -> bool:
+        """Send one email to many recipients in a single SMTP dialog"""
+        if not recipients:
+            return True
+        try:
+            # Email configuration (placeholder), recipients go out as RCPT TO fan-out
+            self.logger.info(f"Email would be sent to {len(recipients)} recipients: {subject}")
+            return True
+
+        except Exception as e:
+            self.logger.error(f"Failed to send bulk email: {str(e)}")
+            return False
+
+
+def _compile_template(template: str):
+    """Pre-parse a str.format template into a renderer taking a kwargs dict"""
+    parts = []
+    for literal, field, spec, conversion in string.Formatter().parse(template):
+        if literal:
+            parts.append((literal, None, None, None))
+        if field is not None:
+            parts.append((None, field, spec, conversion))
+
+    def render(values: Dict[str, Any]) -> str:
+        out = []
+        for literal, field, spec, conversion in parts:
+            if field is None:
+                out.append(literal)
+                continue
+            value = values[field]
+            if conversion == 'r':
+                value = repr(value)
+            elif conversion == 's':
+                value = str(value)
+            elif conversion == 'a':
+                value = ascii(value)
+            out.append(format(value, spec or ''))
+        return ''.join(out)
+
+    return render
+
 
 class NotificationTemplateEngine:
     """Notification template engine"""
@@ -91,17 +216,22 @@ class NotificationTemplateEngine:
                 'email_body': 'Здравствуйте!\n\nЗадача была выполнена: {task_title}',
             }
         }
+        # Parse every template once instead of on each send
+        self.compiled = {
+            notification_type: {name: _compile_template(text) for name, text in templates.items()}
+            for notification_type, templates in self.templates.items()
+        }
 
     def render_template(self, notification_type: NotificationType, template_type: str, **kwargs) -> str:
         """Render notification template"""
-        template = self.templates.get(notification_type, {}).get(template_type, '')
+        renderer = self.compiled.get(notification_type, {}).get(template_type)
 
-        if template:
+        if renderer:
             try:
-                return template.format(**kwargs)
+                return renderer(kwargs)
             except KeyError as e:
                 logging.error(f"Missing template variable: {e}")
-                return template
+                return self.templates[notification_type][template_type]
 
         return ''
 
@@ -112,16 +242,24 @@ class NotificationService:
     Основной сервис уведомлений
     """
 
-    def __init__(self, db_session: Session, config):
+    def __init__(self, db_session: Session, config, executor: Optional[Executor] = None):
+        # Caller's session: notifications are flushed into it, the caller commits
         self.db = db_session
         self.config = config
         self.logger = logging.getLogger(__name__)
         self.email_sender = EmailSender(config)
         self.template_engine = NotificationTemplateEngine()
-        self.in_app_notifications: Dict[int, List[Notification]] = {}
+        self._executor = executor
+        # Emails that failed on the worker pool, callers only learn they were queued
+        self.email_failures = 0
+        self._email_failures_lock = threading.Lock()
+        self._notification_by_id: Dict[str, Notification] = {}
+        self.in_app_notifications: Dict[int, NotificationBuffer] = defaultdict(
+            lambda: NotificationBuffer(self._notification_by_id)
+        )
 
     def send_notification(self, notification: Notification) -> bool:
-        """Send notification through specified channels"""
+        """Send notification through specified channels (emails count as sent once queued)"""
         success = True
 
         try:
@@ -130,7 +268,7 @@ class NotificationService:
                 if channel == NotificationChannel.EMAIL:
                     success = success and self._send_email_notification(notification)
                 elif channel == NotificationChannel.IN_APP:
-                    self._store_in_app_notification(notification)
+                    success = self._store_in_app_notifications([notification]) and success
 
             return success
 
@@ -138,13 +276,46 @@ class NotificationService:
             self.logger.error(f"Failed to send notification: {str(e)}")
             return False
 
+    def _dispatch_email(self, send, *args):
+        """Hand an email off to the worker pool so callers don't wait on SMTP"""
+        executor = self._executor or _get_email_executor()
+        future = executor.submit(send, *args)
+        future.add_done_callback(self._on_email_done)
+        return future
+
+    def _on_email_done(self, future):
+        """Log and count emails that failed on the worker pool"""
+        try:
+            # Senders log their own SMTP errors and return False
+            sent = future.result()
+        except Exception as e:
+            self.logger.error(f"Email delivery failed: {str(e)}")
+            sent = False
+        if not sent:
+            with self._email_failures_lock:
+                self.email_failures += 1
+
+    def get_task_with_context(self, task_id: int):
+        """Load task with assignees, dependencies and subtasks in one round trip each"""
+        from app.models.task import Task
+
+        return self.db.execute(
+            select(Task)
+            .where(Task.id == task_id)
+            .options(
+                selectinload(Task.assignees),
+                selectinload(Task.dependencies),
+                selectinload(Task.subtasks)
+            )
+        ).scalar_one_or_none()
+
     def _send_email_notification(self, notification: Notification) -> bool:
-        """Send email notification"""
+        """Queue email notification (True means queued, failures are counted in email_failures)"""
         try:
             from app.models.user import User
 
-            # Get user
-            user = self.db.get(User, notification.user_id)
+            # Get user (only the email is needed)
+            user = self.db.get(User, notification.user_id, options=[raiseload("*")])
             if not user or not user.email:
                 return False
 
@@ -161,64 +332,169 @@ class NotificationService:
                 **notification.data
             ) or notification.message
 
-            return self.email_sender.send_email(user.email, subject, body)
+            self._dispatch_email(self.email_sender.send_email, user.email, subject, body)
+            return True
 
         except Exception as e:
             self.logger.error(f"Email notification error: {str(e)}")
             return False
 
-    def _store_in_app_notification(self, notification: Notification):
-        """Store in-app notification"""
-        if notification.user_id not in self.in_app_notifications:
-            self.in_app_notifications[notification.user_id] = []
+    def _store_in_app_notifications(self, notifications: List[Notification]) -> bool:
+        """Store in-app notifications, flushed into the caller's session which owns the commit"""
+        if self.db is None:
+            for notification in notifications:
+                # Bounded deque drops the oldest notification past the per-user limit
+                self.in_app_notifications[notification.user_id].append(notification)
+            return True
 
-        self.in_app_notifications[notification.user_id].append(notification)
+        from app.models.notification import UserNotification
 
-        # Keep only last 100 notifications per user
-        if len(self.in_app_notifications[notification.user_id]) > 100:
-            self.in_app_notifications[notification.user_id] =                 self.in_app_notifications[notification.user_id][-100:]
+        # SAVEPOINT: a failed insert rolls back only the notifications, not the caller's work
+        savepoint = self.db.begin_nested()
+        try:
+            self.db.add_all([
+                UserNotification(
+                    key=notification.id,
+                    user_id=notification.user_id,
+                    title=notification.title,
+                    message=notification.message,
+                    notification_type=notification.notification_type.value,
+                    data=_json_safe(notification.data),
+                    created_at=notification.created_at
+                )
+                for notification in notifications
+            ])
+            savepoint.commit()
+            return True
+        except Exception as e:
+            savepoint.rollback()
+            self.logger.error(f"Failed to store in-app notifications: {str(e)}")
+            return False
 
     def get_user_notifications(self, user_id: int, unread_only: bool = False, limit: int = 50) -> List[Notification]:
         """Get notifications for user"""
-        user_notifications = self.in_app_notifications.get(user_id, [])
+        if self.db is not None:
+            return self._query_user_notifications(user_id, unread_only, limit)
 
-        if unread_only:
-            user_notifications = [n for n in user_notifications if n.read_at is None]
+        user_notifications = self.in_app_notifications.get(user_id, ())
+
+        if not unread_only:
+            # Stored in arrival order, so the newest are at the right end
+            return list(islice(reversed(user_notifications), limit))
+
+        # Newest unread first, without sorting the whole buffer
+        return heapq.nlargest(
+            limit,
+            (n for n in user_notifications if n.read_at is None),
+            key=lambda x: x.created_at
+        )
+
+    def _query_user_notifications(self, user_id: int, unread_only: bool, limit: int) -> List[Notification]:
+        """Filter, order and limit persisted notifications in SQL"""
+        from app.models.notification import UserNotification
 
-        # Sort by creation time (newest first)
-        user_notifications.sort(key=lambda x: x.created_at, reverse=True)
-        return user_notifications[:limit]
+        stmt = select(UserNotification).where(UserNotification.user_id == user_id)
+        if unread_only:
+            stmt = stmt.where(UserNotification.read_at.is_(None))
+        stmt = stmt.order_by(UserNotification.created_at.desc()).limit(limit)
+
+        return [
+            Notification(
+                id=row.key,
+                user_id=row.user_id,
+                title=row.title,
+                message=row.message,
+                notification_type=NotificationType(row.notification_type),
+                data=row.data or {},
+                created_at=row.created_at,
+                read_at=row.read_at
+            )
+            for row in self.db.scalars(stmt)
+        ]
 
     def mark_notification_read(self, user_id: int, notification_id: str) -> bool:
         """Mark notification as read"""
-        user_notifications = self.in_app_notifications.get(user_id, [])
+        read_at = datetime.utcnow()
 
-        for notification in user_notifications:
-            if notification.id == notification_id:
-                notification.read_at = datetime.utcnow()
+        if self.db is None:
+            notification = self._notification_by_id.get(notification_id)
+            if notification and notification.user_id == user_id:
+                notification.read_at = read_at
                 return True
+            return False
 
-        return False
+        from app.models.notification import UserNotification
+
+        result = self.db.execute(
+            update(UserNotification)
+            .where(
+                UserNotification.key == notification_id,
+                UserNotification.user_id == user_id,
+                UserNotification.read_at.is_(None)
+            )
+            .values(read_at=read_at)
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount > 0
+
+    def _load_user_emails(self, user_ids: List[int]) -> Dict[int, str]:
+        """Load emails for many users in one query"""
+        from app.models.user import User
+
+        if not user_ids:
+            return {}
+        rows = self.db.execute(select(User.id, User.email).where(User.id.in_(user_ids))).all()
+        return {user_id: email for user_id, email in rows if email}
 
     def send_task_assigned_notification(self, task_data: Dict[str, Any], assignee_user_ids: List[int]) -> bool:
-        """Send task assignment notification"""
-        success = True
+        """
+        Send task assignment notification
+        True means in-app notifications are stored and the email is queued, not delivered
+        """
+        try:
+            title = "Новая задача назначена"
+            message = f"Вам назначена задача: {task_data.get('title')}"
+
+            stored = self._store_in_app_notifications([
+                Notification(
+                    id=f"task_assigned_{task_data.get('id')}_{user_id}",
+                    user_id=user_id,
+                    title=title,
+                    message=message,
+                    notification_type=NotificationType.TASK_ASSIGNED,
+                    channels=[NotificationChannel.EMAIL, NotificationChannel.IN_APP],
+                    data=task_data
+                )
+                for user_id in assignee_user_ids
+            ])
+            if not stored:
+                return False
 
-        for user_id in assignee_user_ids:
-            notification = Notification(
-                id=f"task_assigned_{task_data.get('id')}_{user_id}",
-                user_id=user_id,
-                title="Новая задача назначена",
-                message=f"Вам назначена задача: {task_data.get('title')}",
-                notification_type=NotificationType.TASK_ASSIGNED,
-                channels=[NotificationChannel.EMAIL, NotificationChannel.IN_APP],
-                data=task_data
-            )
+            # Email addresses live in the database, without a session only in-app delivery works
+            if self.db is None:
+                return True
+            emails = self._load_user_emails(assignee_user_ids)
 
-            result = self.send_notification(notification)
-            success = success and result
+            # Template depends only on the task, render it once for all assignees
+            subject = self.template_engine.render_template(
+                NotificationType.TASK_ASSIGNED, 'email_subject', **task_data
+            ) or title
+            body = self.template_engine.render_template(
+                NotificationType.TASK_ASSIGNED, 'email_body', **task_data
+            ) or message
+
+            recipients = [emails[user_id] for user_id in assignee_user_ids if user_id in emails]
+            if len(recipients) < len(assignee_user_ids):
+                self.logger.warning(
+                    f"No email for {len(assignee_user_ids) - len(recipients)} assignees of task {task_data.get('id')}"
+                )
+            if recipients:
+                self._dispatch_email(self.email_sender.send_bulk, recipients, subject, body)
+            return True
 
-        return success
+        except Exception as e:
+            self.logger.error(f"Failed to send task assigned notification: {str(e)}")
+            return False
 
     def send_task_completed_notification(self, task_data: Dict[str, Any], stakeholder_user_ids: List[int]) -> bool:
         """Send task completion notification"""
@@ -245,13 +521,18 @@ class NotificationService:
         cutoff_date = datetime.utcnow() - timedelta(days=days_old)
         cleaned_count = 0
 
-        for user_id in self.in_app_notifications:
-            original_count = len(self.in_app_notifications[user_id])
-            self.in_app_notifications[user_id] = [
-                n for n in self.in_app_notifications[user_id]
-                if n.created_at > cutoff_date
-            ]
-            cleaned_count += original_count - len(self.in_app_notifications[user_id])
+        if self.db is not None:
+            from app.models.notification import UserNotification
+
+            result = self.db.execute(
+                delete(UserNotification)
+                .where(UserNotification.created_at <= cutoff_date)
+                .execution_options(synchronize_session=False)
+            )
+            cleaned_count = result.rowcount
+        else:
+            for user_notifications in self.in_app_notifications.values():
+                cleaned_count += user_notifications.evict_older_than(cutoff_date)
 
         self.logger.info(f"Cleaned up {cleaned_count} old notifications")
         return cleaned_count
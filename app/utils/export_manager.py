@@ -7,10 +7,33 @@ Advanced data export functionality with multiple formats
 
 import io
 import csv
+import functools
 import json
 import logging
 from datetime import datetime, date
-from typing import List, Dict, Any, Optional, Union
+from itertools import chain, count
+from operator import attrgetter, itemgetter
+from typing import List, Dict, Any, Optional, Union, Iterable, Iterator, TextIO
+
+try:
+    import orjson
+except ImportError:  # optional, stdlib json is used without it
+    orjson = None
+
+try:
+    from markupsafe import escape as _markup_escape
+
+    def _escape(text: str) -> str:
+        return str(_markup_escape(text))
+except ImportError:  # optional C speedups, stdlib escaping otherwise
+    from html import escape as _escape
+
+
+def _json_default(obj):
+    """JSON serializer for datetime objects"""
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj)} is not JSON serializable")
 
 
 class ExportFormat:
@@ -22,41 +45,191 @@ class ExportFormat:
     HTML = "html"
 
 
+def _enum_value(attr: str, missing: str = ''):
+    """Column getter returning enum .value (str() for plain values)"""
+    def get(obj):
+        value = getattr(obj, attr, None)
+        if value is None:
+            return missing
+        return value.value if hasattr(value, 'value') else str(value)
+    return get
+
+
+def _attr_or(attr: str, default):
+    """Column getter with a default for missing or empty attributes"""
+    def get(obj):
+        return getattr(obj, attr, None) or default
+    return get
+
+
+def _task_project_name(task) -> str:
+    project = getattr(task, 'project', None)
+    return project.name if project else ''
+
+
+# Static parts of the HTML report
+_HTML_HEAD = """<!DOCTYPE html>
+<html lang="ru">
+<head>
+<meta charset="UTF-8">
+<meta name="viewport" content="width=device-width, initial-scale=1.0">
+<title>{title}</title>
+<style>
+body {{ font-family: Arial, sans-serif; margin: 20px; background-color: #f5f5f5; }}
+.container {{ background-color: white; padding: 30px; border-radius: 8px; }}
+h1 {{ color: #333; text-align: center; margin-bottom: 30px; }}
+table {{ width: 100%; border-collapse: collapse; margin: 20px 0; }}
+th, td {{ border: 1px solid #ddd; padding: 12px; text-align: left; }}
+th {{ background-color: #f8f9fa; font-weight: bold; color: #495057; }}
+tr:nth-child(even) {{ background-color: #f8f9fa; }}
+</style>
+</head>
+<body>
+<div class="container">
+<h1>{title}</h1>"""
+
+_HTML_FOOT = """<p>Сгенерировано: {generation_time}</p>
+</div>
+</body>
+</html>"""
+
+# Empty results are common on filtered UI refreshes, serve them from constants
+_EMPTY_CSV = ""
+_EMPTY_HTML_BODY = '<p>Нет данных для отображения</p>'
+
+
+@functools.lru_cache(maxsize=32)
+def _empty_html_head(title: str) -> str:
+    """Page head with the empty-data notice (cached per title)"""
+    return f"{_HTML_HEAD.format(title=_escape(title))}\n{_EMPTY_HTML_BODY}"
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_day(day: date) -> str:
+    """Format date for HTML table (cached, exports repeat the same days a lot)"""
+    return day.strftime("%d.%m.%Y")
+
+
+def _format_html_cell(value) -> str:
+    """Format cell value for HTML table"""
+    if isinstance(value, datetime):
+        return _format_day(value.date())
+    if isinstance(value, date):
+        return _format_day(value)
+    if value is None:
+        return ""
+    if isinstance(value, (int, float)):
+        # Numbers can't contain markup, skip escaping
+        return str(value)
+    return _escape(str(value))
+
+
+@functools.lru_cache(maxsize=64)
+def _compile_row_formatter(headers: tuple, sample_types: tuple):
+    """
+    Generate a row-to-HTML function with one unrolled cell per column
+    Each cell takes a fast path for the column's sample type and falls back to _format_html_cell
+    """
+    lines = ['def format_row(item):']
+    cells = []
+    for n, (header, sample_type) in enumerate(zip(headers, sample_types)):
+        lines.append(f'    v{n} = item[{header!r}]')
+        if sample_type is datetime:
+            fast = f'_d(v{n}.date())'
+        elif sample_type is date:
+            fast = f'_d(v{n})'
+        elif sample_type is str:
+            fast = f'_e(v{n})'
+        elif sample_type is int:
+            fast = f'v{n}'
+        else:
+            cells.append(f'<td>{{_f(v{n})}}</td>')
+            continue
+        cells.append(f'<td>{{{fast} if v{n}.__class__ is {sample_type.__name__} else _f(v{n})}}</td>')
+    body = '\\n'.join(['<tr>', *cells, '</tr>'])
+    lines.append(f"    return f'{body}'")
+
+    namespace = {'_f': _format_html_cell, '_e': _escape, '_d': _format_day, 'date': date, 'datetime': datetime, 'str': str, 'int': int}
+    exec('\n'.join(lines), namespace)
+    return namespace['format_row']
+
+
+# Export columns as (header, getter) pairs
+PROJECT_FIELDS = (
+    ('ID', attrgetter('id')),
+    ('Код', _attr_or('code', '')),
+    ('Название', attrgetter('name')),
+    ('Описание', _attr_or('description', '')),
+    ('Статус', _enum_value('status')),
+    ('Приоритет', _enum_value('priority')),
+    ('Дата создания', attrgetter('created_at')),
+    ('Прогресс (%)', _attr_or('progress', 0)),
+)
+
+TASK_FIELDS = (
+    ('ID', attrgetter('id')),
+    ('Название', attrgetter('title')),
+    ('Описание', _attr_or('description', '')),
+    ('Статус', _enum_value('status')),
+    ('Приоритет', _enum_value('priority')),
+    ('Проект', _task_project_name),
+    ('Дата создания', attrgetter('created_at')),
+    ('Прогресс (%)', _attr_or('progress', 0)),
+)
+
+
+def build_rows(items: Iterable[Any], schema) -> Iterator[Dict[str, Any]]:
+    """Lazily build export rows from objects using a (header, getter) schema"""
+    return ({name: get(item) for name, get in schema} for item in items)
+
+
 class DataExporter:
     """Base data exporter class"""
 
     def __init__(self):
         self.logger = logging.getLogger(__name__)
 
-    def export_to_csv(self, data: List[Dict[str, Any]], filename: str = None) -> str:
-        """Export data to CSV format"""
-        if not data:
-            return ""
-
-        output = io.StringIO()
+    @staticmethod
+    def _iter_csv_rows(data: Iterable[Dict[str, Any]]) -> Iterator[List[Any]]:
+        """Yield CSV header then one formatted row per item"""
+        rows = iter(data)
+        first = next(rows, None)
+        if first is None:
+            return
 
         # Get field names from first row
-        fieldnames = list(data[0].keys())
-
-        writer = csv.DictWriter(output, fieldnames=fieldnames)
-        writer.writeheader()
-
-        for row in data:
-            # Convert objects to strings
-            clean_row = {}
-            for key, value in row.items():
-                if isinstance(value, (datetime, date)):
-                    clean_row[key] = value.isoformat()
-                elif value is None:
-                    clean_row[key] = ""
-                else:
-                    clean_row[key] = str(value)
-            writer.writerow(clean_row)
+        fieldnames = list(first.keys())
+        yield fieldnames
+
+        for row in chain((first,), rows):
+            # csv writes None as an empty field; dates need ISO format
+            yield [
+                value.isoformat() if isinstance(value, (datetime, date)) else value
+                for value in (row.get(key) for key in fieldnames)
+            ]
+
+    def export_csv_stream(self, data: Iterable[Dict[str, Any]], fp: TextIO) -> int:
+        """Write data as CSV to a file-like object row by row, return number of data rows"""
+        # writerows drives the loop in C (what pandas.to_csv does underneath); count rows on the way
+        counter = count()
+        csv.writer(fp).writerows(map(itemgetter(0), zip(self._iter_csv_rows(data), counter)))
+        return max(next(counter) - 1, 0)
+
+    def export_to_csv(self, data: Iterable[Dict[str, Any]], filename: str = None) -> str:
+        """Export data to CSV format (returns the content, like every export_to_* writer)"""
+        rows = iter(data)
+        first = next(rows, None)
+        if first is None:
+            return _EMPTY_CSV
+        data = chain((first,), rows)
 
+        output = io.StringIO()
+        self.export_csv_stream(data, output)
         content = output.getvalue()
         output.close()
 
         if filename:
+            # Callers that must not hold the whole CSV in memory use export_csv_stream directly
             with open(filename, 'w', encoding='utf-8', newline='') as f:
                 f.write(content)
 
@@ -64,119 +237,83 @@ class DataExporter:
 
     def export_to_json(self, data: List[Dict[str, Any]], filename: str = None) -> str:
         """Export data to JSON format"""
-
-        def json_serializer(obj):
-            """JSON serializer for datetime objects"""
-            if isinstance(obj, (datetime, date)):
-                return obj.isoformat()
-            raise TypeError(f"Object of type {type(obj)} is not JSON serializable")
-
-        json_content = json.dumps(data, indent=2, ensure_ascii=False, default=json_serializer)
+        if orjson is not None:
+            # orjson encodes datetimes natively and produces UTF-8 bytes directly
+            json_bytes = orjson.dumps(
+                data, default=_json_default, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            )
+        else:
+            json_bytes = json.dumps(data, indent=2, ensure_ascii=False, default=_json_default).encode('utf-8')
 
         if filename:
-            with open(filename, 'w', encoding='utf-8') as f:
-                f.write(json_content)
+            with open(filename, 'wb') as f:
+                f.write(json_bytes)
 
-        return json_content
+        return json_bytes.decode('utf-8')
 
     def export_to_html(self, data: List[Dict[str, Any]], filename: str = None, title: str = "Отчет") -> str:
         """Export data to HTML format"""
-        html_parts = []
-        html_parts.append('<!DOCTYPE html>')
-        html_parts.append('<html lang="ru">')
-        html_parts.append('<head>')
-        html_parts.append('<meta charset="UTF-8">')
-        html_parts.append('<meta name="viewport" content="width=device-width, initial-scale=1.0">')
-        html_parts.append(f'<title>{title}</title>')
-        html_parts.append('<style>')
-        html_parts.append('body { font-family: Arial, sans-serif; margin: 20px; background-color: #f5f5f5; }')
-        html_parts.append('.container { background-color: white; padding: 30px; border-radius: 8px; }')
-        html_parts.append('h1 { color: #333; text-align: center; margin-bottom: 30px; }')
-        html_parts.append('table { width: 100%; border-collapse: collapse; margin: 20px 0; }')
-        html_parts.append('th, td { border: 1px solid #ddd; padding: 12px; text-align: left; }')
-        html_parts.append('th { background-color: #f8f9fa; font-weight: bold; color: #495057; }')
-        html_parts.append('tr:nth-child(even) { background-color: #f8f9fa; }')
-        html_parts.append('</style>')
-        html_parts.append('</head>')
-        html_parts.append('<body>')
-        html_parts.append('<div class="container">')
-        html_parts.append(f'<h1>{title}</h1>')
+        generation_time = datetime.now().strftime("%d.%m.%Y %H:%M")
+        html_foot = _HTML_FOOT.format(generation_time=generation_time)
 
         if not data:
-            html_parts.append('<p>Нет данных для отображения</p>')
+            html_content = f"{_empty_html_head(title)}\n{html_foot}"
         else:
-            html_parts.append('<table>')
-
-            # Headers
             headers = list(data[0].keys())
-            html_parts.append('<thead><tr>')
-            for header in headers:
-                html_parts.append(f'<th>{header}</th>')
-            html_parts.append('</tr></thead>')
-
-            # Data rows
-            html_parts.append('<tbody>')
-            for item in data:
-                html_parts.append('<tr>')
-                for key in headers:
-                    value = item[key]
-                    if isinstance(value, (datetime, date)):
-                        formatted_value = value.strftime("%d.%m.%Y")
-                    elif value is None:
-                        formatted_value = ""
-                    else:
-                        formatted_value = str(value)
-                    html_parts.append(f'<td>{formatted_value}</td>')
-                html_parts.append('</tr>')
+            header_html = '\n'.join(f'<th>{_escape(str(header))}</th>' for header in headers)
+            html_parts = [
+                _HTML_HEAD.format(title=_escape(title)),
+                f'<table>\n<thead><tr>\n{header_html}\n</tr></thead>\n<tbody>'
+            ]
+
+            # Straight-line row formatter specialized on the first row's value types
+            format_row = _compile_row_formatter(
+                tuple(headers), tuple(type(data[0][key]) for key in headers)
+            )
+            html_parts.extend(map(format_row, data))
             html_parts.append('</tbody></table>')
+            html_parts.append(html_foot)
 
-        generation_time = datetime.now().strftime("%d.%m.%Y %H:%M")
-        html_parts.append(f'<p>Сгенерировано: {generation_time}</p>')
-        html_parts.append('</div>')
-        html_parts.append('</body>')
-        html_parts.append('</html>')
-
-        html_content = '\n'.join(html_parts)
+            html_content = '\n'.join(html_parts)
 
         if filename:
-            with open(filename, 'w', encoding='utf-8') as f:
-                f.write(html_content)
+            # One UTF-8 pass over the joined document, written as raw bytes
+            with open(filename, 'wb') as f:
+                f.write(html_content.encode('utf-8'))
 
         return html_content
 
+    def _export_csv_rows(self, data: Iterable[Dict[str, Any]], filename: str, title: str) -> str:
+        return self.export_to_csv(data, filename)
+
+    def _export_json_rows(self, data: Iterable[Dict[str, Any]], filename: str, title: str) -> str:
+        return self.export_to_json(list(data), filename)
+
+    def _export_html_rows(self, data: Iterable[Dict[str, Any]], filename: str, title: str) -> str:
+        return self.export_to_html(list(data), filename, title)
+
+    # Export format -> writer, one hash lookup instead of an if/elif chain
+    _FORMAT_DISPATCH = {
+        ExportFormat.CSV: _export_csv_rows,
+        ExportFormat.JSON: _export_json_rows,
+        ExportFormat.HTML: _export_html_rows,
+    }
+
+    def _export_by_format(self, data: Iterable[Dict[str, Any]], export_format: str, filename: str = None, title: str = "Отчет") -> str:
+        """Export data in specified format"""
+        try:
+            export = self._FORMAT_DISPATCH[export_format]
+        except KeyError:
+            raise ValueError(f"Unsupported export format: {export_format}") from None
+        return export(self, data, filename, title)
+
 
 class ProjectExporter(DataExporter):
     """Project-specific data exporter"""
 
     def export_projects(self, projects, export_format: str, filename: str = None) -> Union[str, bytes]:
         """Export projects data"""
-        data = []
-
-        for project in projects:
-            project_data = {
-                'ID': project.id,
-                'Код': getattr(project, 'code', ''),
-                'Название': project.name,
-                'Описание': project.description or '',
-                'Статус': project.status.value if hasattr(project.status, 'value') else str(project.status),
-                'Приоритет': getattr(project, 'priority', {}).get('value', '') if hasattr(getattr(project, 'priority', None), 'value') else '',
-                'Дата создания': project.created_at,
-                'Прогресс (%)': getattr(project, 'progress', 0)
-            }
-            data.append(project_data)
-
-        return self._export_by_format(data, export_format, filename, "Проекты")
-
-    def _export_by_format(self, data: List[Dict[str, Any]], export_format: str, filename: str = None, title: str = "Отчет") -> str:
-        """Export data in specified format"""
-        if export_format == ExportFormat.CSV:
-            return self.export_to_csv(data, filename)
-        elif export_format == ExportFormat.JSON:
-            return self.export_to_json(data, filename)
-        elif export_format == ExportFormat.HTML:
-            return self.export_to_html(data, filename, title)
-        else:
-            raise ValueError(f"Unsupported export format: {export_format}")
+        return self._export_by_format(build_rows(projects, PROJECT_FIELDS), export_format, filename, "Проекты")
 
 
 class TaskExporter(DataExporter):
@@ -184,33 +321,7 @@ class TaskExporter(DataExporter):
 
     def export_tasks(self, tasks, export_format: str, filename: str = None) -> Union[str, bytes]:
         """Export tasks data"""
-        data = []
-
-        for task in tasks:
-            task_data = {
-                'ID': task.id,
-                'Название': task.title,
-                'Описание': task.description or '',
-                'Статус': task.status.value if hasattr(task.status, 'value') else str(task.status),
-                'Приоритет': getattr(task, 'priority', {}).get('value', '') if hasattr(getattr(task, 'priority', None), 'value') else '',
-                'Проект': task.project.name if hasattr(task, 'project') and task.project else '',
-                'Дата создания': task.created_at,
-                'Прогресс (%)': getattr(task, 'progress', 0)
-            }
-            data.append(task_data)
-
-        return self._export_by_format(data, export_format, filename, "Задачи")
-
-    def _export_by_format(self, data: List[Dict[str, Any]], export_format: str, filename: str = None, title: str = "Отчет") -> str:
-        """Export data in specified format"""
-        if export_format == ExportFormat.CSV:
-            return self.export_to_csv(data, filename)
-        elif export_format == ExportFormat.JSON:
-            return self.export_to_json(data, filename)
-        elif export_format == ExportFormat.HTML:
-            return self.export_to_html(data, filename, title)
-        else:
-            raise ValueError(f"Unsupported export format: {export_format}")
+        return self._export_by_format(build_rows(tasks, TASK_FIELDS), export_format, filename, "Задачи")
 
 
 class ExportManager:
@@ -221,21 +332,20 @@ class ExportManager:
 
     def __init__(self):
         self.logger = logging.getLogger(__name__)
-        self.project_exporter = ProjectExporter()
-        self.task_exporter = TaskExporter()
-        self.data_exporter = DataExporter()
+        # Entity exports differ only in their column schema, one exporter serves all
+        self.exporter = DataExporter()
 
     def get_supported_formats(self) -> List[str]:
         """Get list of supported export formats"""
-        return [ExportFormat.CSV, ExportFormat.JSON, ExportFormat.HTML]
+        return list(DataExporter._FORMAT_DISPATCH)
 
     def export_projects(self, projects, export_format: str, filename: str = None) -> str:
         """Export projects list"""
-        return self.project_exporter.export_projects(projects, export_format, filename)
+        return self.exporter._export_by_format(build_rows(projects, PROJECT_FIELDS), export_format, filename, "Проекты")
 
     def export_tasks(self, tasks, export_format: str, filename: str = None) -> str:
         """Export tasks list"""
-        return self.task_exporter.export_tasks(tasks, export_format, filename)
+        return self.exporter._export_by_format(build_rows(tasks, TASK_FIELDS), export_format, filename, "Задачи")
 
     def validate_format(self, export_format: str) -> bool:
         """Validate export format"""
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Security Utilities - Утилиты безопасности
+Password hashing with a tunable bcrypt cost
+"""
+
+import hmac
+import time
+import hashlib
+import logging
+
+import bcrypt
+from werkzeug.security import check_password_hash
+
+# Default bcrypt cost factor (2**rounds key expansion iterations)
+DEFAULT_BCRYPT_ROUNDS = 12
+# Floor for calibration and persisted settings: a slow first start must not store a weak cost
+MIN_BCRYPT_ROUNDS = 10
+MAX_BCRYPT_ROUNDS = 16
+
+# bcrypt only uses the first 72 bytes of a password
+_BCRYPT_MAX_BYTES = 72
+
+_rounds = DEFAULT_BCRYPT_ROUNDS
+
+logger = logging.getLogger(__name__)
+
+
+def _encode(password: str) -> bytes:
+    """Encode password for bcrypt"""
+    return password.encode("utf-8")[:_BCRYPT_MAX_BYTES]
+
+
+def set_bcrypt_rounds(rounds: int):
+    """Set the cost factor used for new password hashes"""
+    global _rounds
+    _rounds = max(MIN_BCRYPT_ROUNDS, min(MAX_BCRYPT_ROUNDS, int(rounds)))
+
+
+def get_bcrypt_rounds() -> int:
+    """Get the cost factor used for new password hashes"""
+    return _rounds
+
+
+def calibrate_bcrypt_cost(target_ms: float = 250.0) -> int:
+    """
+    Pick the largest bcrypt cost whose hash time stays within target_ms
+    Подбор максимальной стоимости bcrypt в пределах target_ms
+    """
+    best = MIN_BCRYPT_ROUNDS
+    for rounds in range(MIN_BCRYPT_ROUNDS, MAX_BCRYPT_ROUNDS + 1):
+        started = time.perf_counter()
+        bcrypt.hashpw(b"calibration", bcrypt.gensalt(rounds=rounds))
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        if elapsed_ms > target_ms:
+            break
+        best = rounds
+        # Each extra round doubles the cost, stop before overshooting the budget
+        if elapsed_ms * 2 > target_ms:
+            break
+
+    logger.info(f"Calibrated bcrypt cost: {best} rounds")
+    return best
+
+
+def hash_password(password: str) -> str:
+    """Hash password with bcrypt at the configured cost"""
+    return bcrypt.hashpw(_encode(password), bcrypt.gensalt(rounds=_rounds)).decode("ascii")
+
+
+def verify_password(password: str, password_hash: str) -> bool:
+    """Verify password against a bcrypt or legacy werkzeug hash"""
+    if not password_hash:
+        return False
+    if password_hash.startswith("$2"):
+        return bcrypt.checkpw(_encode(password), password_hash.encode("ascii"))
+    return check_password_hash(password_hash, password)
+
+
+def tokens_equal(provided: str | None, stored: str | None) -> bool:
+    """Compare tokens in constant time via equal-length SHA-256 digests"""
+    if not provided or not stored:
+        return False
+    return hmac.compare_digest(
+        hashlib.sha256(provided.encode("utf-8")).digest(),
+        hashlib.sha256(stored.encode("utf-8")).digest()
+    )
+
+
+def needs_rehash(password_hash: str) -> bool:
+    """Check if hash is not bcrypt or uses a different cost"""
+    if not password_hash or not password_hash.startswith("$2"):
+        return True
+    try:
+        return int(password_hash.split("$")[2]) != _rounds
+    except (IndexError, ValueError):
+        return True
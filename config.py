@@ -22,19 +22,93 @@ This module handles all configuration-related functionality including:
 import os
 import sys
 import json
-import yaml
+import base64
+import hashlib
 import logging
 from pathlib import Path
-from typing import Dict, Any, Optional, Union
-from dataclasses import dataclass, asdict, field
+from types import SimpleNamespace
+from typing import Dict, Any, Optional, Union, TYPE_CHECKING
+from dataclasses import dataclass, field, fields
 from datetime import datetime
 import configparser
-from cryptography.fernet import Fernet
-from PyQt6.QtCore import QSettings, QStandardPaths
 
+if TYPE_CHECKING:
+    from cryptography.fernet import Fernet
+    from PyQt6.QtCore import QSettings
 
-@dataclass
-class DatabaseConfig:
+try:
+    import orjson
+except ImportError:  # optional, stdlib json is used without it
+    orjson = None
+
+
+def _json_default(obj):
+    """
+    Encode values JSON has no type for (window state bytes)
+    Кодирование значений, для которых в JSON нет типа
+    """
+    if isinstance(obj, (bytes, bytearray)):
+        return base64.b64encode(obj).decode("ascii")
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _dump_json(data: Dict[str, Any], indent: bool = True) -> bytes:
+    """
+    Serialize configuration to UTF-8 JSON (indented for files people may edit)
+    Сериализация конфигурации в JSON
+    """
+    if orjson is not None:
+        return orjson.dumps(data, default=_json_default, option=orjson.OPT_INDENT_2 if indent else None)
+    return json.dumps(
+        data, default=_json_default, indent=2 if indent else None, ensure_ascii=False
+    ).encode("utf-8")
+
+
+def _parse_json(raw: bytes) -> Any:
+    """
+    Parse JSON bytes
+    Разбор JSON
+    """
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
+def _load_json(path: Path) -> Any:
+    """
+    Read JSON configuration file
+    Чтение JSON файла конфигурации
+    """
+    return _parse_json(path.read_bytes())
+
+
+class ConfigSection:
+    """
+    Mixin caching the dict form of a config dataclass until a field changes
+    Примесь, кэширующая словарь секции конфигурации до изменения поля
+    """
+    __slots__ = ("_cached_dict", "_modified")
+    
+    def __setattr__(self, name: str, value: Any):
+        object.__setattr__(self, name, value)
+        if name not in ConfigSection.__slots__:
+            object.__setattr__(self, "_cached_dict", None)
+            # Cleared by ConfigManager once the section is saved
+            object.__setattr__(self, "_modified", True)
+            
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Get section values as a dictionary (dict and list values are copied)
+        Получить значения секции в виде словаря (словари и списки копируются)
+        """
+        cached = getattr(self, "_cached_dict", None)
+        if cached is None:
+            cached = {f.name: getattr(self, f.name) for f in fields(self)}
+            object.__setattr__(self, "_cached_dict", cached)
+        # Fields like UIConfig.window_geometry are mutable, callers must not get the live object
+        return {k: (v.copy() if isinstance(v, (dict, list)) else v) for k, v in cached.items()}
+        
+
+@dataclass(slots=True)
+class DatabaseConfig(ConfigSection):
     """
     Database configuration settings
     Настройки конфигурации базы данных
@@ -47,15 +121,18 @@ class DatabaseConfig:
     password: str = ""
     sqlite_path: str = "data/project_management.db"
     connection_timeout: int = 30
+    busy_timeout_ms: Optional[int] = None  # SQLite lock wait, ms (at least connection_timeout)
     max_connections: int = 10
+    sqlite_pool_threads: int = 1  # >1 gives SQLite a connection pool instead of one shared connection
     echo_sql: bool = False
     backup_enabled: bool = True
     backup_interval_hours: int = 24
     encryption_enabled: bool = False
+    pgbouncer_mode: bool = False  # PostgreSQL behind PgBouncer transaction pooling
     
 
-@dataclass
-class UIConfig:
+@dataclass(slots=True)
+class UIConfig(ConfigSection):
     """
     User interface configuration
     Конфигурация пользовательского интерфейса
@@ -75,8 +152,8 @@ class UIConfig:
     grid_size: int = 10
     
 
-@dataclass
-class ApplicationConfig:
+@dataclass(slots=True)
+class ApplicationConfig(ConfigSection):
     """
     Main application configuration
     Основная конфигурация приложения
@@ -96,8 +173,8 @@ class ApplicationConfig:
     telemetry_enabled: bool = False
     
 
-@dataclass
-class SecurityConfig:
+@dataclass(slots=True)
+class SecurityConfig(ConfigSection):
     """
     Security-related configuration
     Конфигурация безопасности
@@ -112,10 +189,12 @@ class SecurityConfig:
     max_login_attempts: int = 5
     lockout_duration_minutes: int = 15
     two_factor_enabled: bool = False
+    bcrypt_rounds: int = 0  # 0 = calibrate on first start
+    bcrypt_target_ms: int = 250
     
 
-@dataclass
-class NotificationConfig:
+@dataclass(slots=True)
+class NotificationConfig(ConfigSection):
     """
     Notification system configuration
     Конфигурация системы уведомлений
@@ -129,6 +208,23 @@ class NotificationConfig:
     warning_days_before_deadline: int = 3
     
 
+# Delay before writing Qt settings to disk, rapid saves within it are coalesced
+SETTINGS_SYNC_DELAY_MS = 500
+
+
+# Field names per section, so updates skip hasattr() probing
+_SECTION_FIELDS = {
+    section: frozenset(f.name for f in fields(config_cls))
+    for section, config_cls in (
+        ("application", ApplicationConfig),
+        ("database", DatabaseConfig),
+        ("ui", UIConfig),
+        ("security", SecurityConfig),
+        ("notifications", NotificationConfig),
+    )
+}
+
+
 class ConfigManager:
     """
     Central configuration manager for the application
@@ -141,8 +237,8 @@ class ConfigManager:
         Инициализация менеджера конфигурации
         """
         self.config_dir = config_dir or self._get_config_directory()
-        self.config_file = self.config_dir / "config.yaml"
-        self.user_config_file = self.config_dir / "user_config.yaml"
+        self.config_file = self.config_dir / "config.json"
+        self.user_config_file = self.config_dir / "user_config.json"
         self.encrypted_config_file = self.config_dir / "secure_config.enc"
         
         # Configuration objects
@@ -152,12 +248,17 @@ class ConfigManager:
         self.security_config = SecurityConfig()
         self.notification_config = NotificationConfig()
         
-        # QSettings for Qt-specific settings
-        self.qt_settings = QSettings()
+        # QSettings for Qt-specific settings (created on first use)
+        self._qt_settings: Optional["QSettings"] = None
+        self._sync_pending = False
         
         # Encryption key for sensitive data
         self._encryption_key = None
         
+        # Change tracking: skip writes when nothing has changed
+        self._dirty = True
+        self._last_hash: Optional[bytes] = None
+        
         # Ensure config directory exists
         self.config_dir.mkdir(parents=True, exist_ok=True)
         
@@ -178,19 +279,35 @@ class ConfigManager:
             
         return config_dir
         
+    @property
+    def qt_settings(self) -> "QSettings":
+        """
+        Qt settings store, PyQt6 is imported on first access
+        Хранилище настроек Qt, PyQt6 импортируется при первом обращении
+        """
+        if self._qt_settings is None:
+            from PyQt6.QtCore import QSettings
+            
+            self._qt_settings = QSettings()
+        return self._qt_settings
+        
     def _generate_encryption_key(self) -> str:
         """
         Generate a new encryption key
         Генерация нового ключа шифрования
         """
+        from cryptography.fernet import Fernet
+        
         return Fernet.generate_key().decode()
         
-    def _get_encryption_key(self) -> Fernet:
+    def _get_encryption_key(self) -> "Fernet":
         """
         Get or create encryption key for sensitive data
         Получить или создать ключ шифрования для чувствительных данных
         """
         if self._encryption_key is None:
+            from cryptography.fernet import Fernet
+            
             key_file = self.config_dir / "key.enc"
             
             if key_file.exists():
@@ -205,6 +322,20 @@ class ConfigManager:
             
         return self._encryption_key
         
+    def _encrypt_bytes(self, raw: bytes) -> bytes:
+        """
+        Encrypt bytes without str round-trips
+        Шифрование байтов без преобразования в строки
+        """
+        return self._get_encryption_key().encrypt(raw)
+        
+    def _decrypt_bytes(self, token: bytes) -> bytes:
+        """
+        Decrypt bytes without str round-trips
+        Расшифровка байтов без преобразования в строки
+        """
+        return self._get_encryption_key().decrypt(token)
+        
     def encrypt_sensitive_data(self, data: str) -> str:
         """
         Encrypt sensitive configuration data
@@ -229,18 +360,18 @@ class ConfigManager:
         Загрузка конфигурации из файлов
         """
         try:
+            self._migrate_legacy_config()
+            
             # Load main configuration
             if self.config_file.exists():
-                with open(self.config_file, "r", encoding="utf-8") as f:
-                    config_data = yaml.safe_load(f)
+                config_data = _load_json(self.config_file)
                     
                 if config_data:
                     self._update_config_objects(config_data)
                     
             # Load user-specific configuration
             if self.user_config_file.exists():
-                with open(self.user_config_file, "r", encoding="utf-8") as f:
-                    user_config_data = yaml.safe_load(f)
+                user_config_data = _load_json(self.user_config_file)
                     
                 if user_config_data:
                     self._update_config_objects(user_config_data)
@@ -260,22 +391,38 @@ class ConfigManager:
         Save configuration to files
         Сохранение конфигурации в файлы
         """
+        if not self.is_dirty:
+            return True
+            
         try:
             # Prepare configuration data
             config_data = {
-                "application": asdict(self.app_config),
-                "database": asdict(self.db_config),
-                "ui": asdict(self.ui_config),
-                "notifications": asdict(self.notification_config)
+                "application": self.app_config.to_dict(),
+                "database": self.db_config.to_dict(),
+                "ui": self.ui_config.to_dict(),
+                "notifications": self.notification_config.to_dict()
             }
+            payload = _dump_json(config_data)
+            
+            # Skip the write if the content is unchanged since the last save
+            digest = hashlib.blake2b(payload, digest_size=16)
+            digest.update(json.dumps(self.security_config.to_dict(), sort_keys=True).encode("utf-8"))
+            content_hash = digest.digest()
+            if content_hash == self._last_hash:
+                self._mark_clean()
+                return True
             
-            # Save main configuration
-            with open(self.config_file, "w", encoding="utf-8") as f:
-                yaml.dump(config_data, f, default_flow_style=False, allow_unicode=True)
+            # Save main configuration atomically
+            tmp_file = self.config_file.with_suffix(".json.tmp")
+            with open(tmp_file, "wb") as f:
+                f.write(payload)
+            os.replace(tmp_file, self.config_file)
                 
             # Save encrypted sensitive configuration
             self._save_encrypted_config()
             
+            self._last_hash = content_hash
+            self._mark_clean()
             self.logger.info("Configuration saved successfully")
             return True
             
@@ -283,35 +430,61 @@ class ConfigManager:
             self.logger.error(f"Failed to save configuration: {e}")
             return False
             
+    def _section_objects(self) -> Dict[str, Any]:
+        """
+        Map section names to configuration objects
+        Соответствие имен секций объектам конфигурации
+        """
+        return {
+            "application": self.app_config,
+            "database": self.db_config,
+            "ui": self.ui_config,
+            "security": self.security_config,
+            "notifications": self.notification_config
+        }
+        
+    def _migrate_legacy_config(self):
+        """
+        Convert YAML configuration files from older versions to JSON once
+        Однократное преобразование YAML конфигурации старых версий в JSON
+        """
+        for json_file in (self.config_file, self.user_config_file):
+            yaml_file = json_file.with_suffix(".yaml")
+            if json_file.exists() or not yaml_file.exists():
+                continue
+            
+            import yaml
+            
+            with open(yaml_file, "r", encoding="utf-8") as f:
+                legacy_data = yaml.safe_load(f) or {}
+            json_file.write_bytes(_dump_json(legacy_data))
+            self.logger.info(f"Migrated {yaml_file.name} to {json_file.name}")
+            
     def _update_config_objects(self, config_data: Dict[str, Any]):
         """
         Update configuration objects with loaded data
         Обновление объектов конфигурации загруженными данными
         """
-        if "application" in config_data:
-            app_data = config_data["application"]
-            for key, value in app_data.items():
-                if hasattr(self.app_config, key):
-                    setattr(self.app_config, key, value)
-                    
-        if "database" in config_data:
-            db_data = config_data["database"]
-            for key, value in db_data.items():
-                if hasattr(self.db_config, key):
-                    setattr(self.db_config, key, value)
-                    
-        if "ui" in config_data:
-            ui_data = config_data["ui"]
-            for key, value in ui_data.items():
-                if hasattr(self.ui_config, key):
-                    setattr(self.ui_config, key, value)
-                    
-        if "notifications" in config_data:
-            notif_data = config_data["notifications"]
-            for key, value in notif_data.items():
-                if hasattr(self.notification_config, key):
-                    setattr(self.notification_config, key, value)
-                    
+        sections = self._section_objects()
+        for section, values in config_data.items():
+            config_obj = sections.get(section)
+            if config_obj is None or section == "security":
+                continue
+            if section == "ui" and isinstance(values.get("window_state"), str):
+                # JSON stores window state bytes as base64 text
+                values["window_state"] = base64.b64decode(values["window_state"])
+            self._apply_values(section, config_obj, values)
+            
+    def _apply_values(self, section: str, config_obj: Any, values: Dict[str, Any]):
+        """
+        Assign known fields of a section, ignoring unknown keys
+        Присвоение известных полей секции, неизвестные ключи пропускаются
+        """
+        field_names = _SECTION_FIELDS[section]
+        for key, value in values.items():
+            if key in field_names:
+                setattr(config_obj, key, value)
+                
     def _load_encrypted_config(self):
         """
         Load encrypted sensitive configuration
@@ -319,16 +492,11 @@ class ConfigManager:
         """
         try:
             if self.encrypted_config_file.exists():
-                with open(self.encrypted_config_file, "r", encoding="utf-8") as f:
-                    encrypted_data = f.read()
-                    
-                decrypted_data = self.decrypt_sensitive_data(encrypted_data)
-                sensitive_config = json.loads(decrypted_data)
+                decrypted_data = self._decrypt_bytes(self.encrypted_config_file.read_bytes())
+                sensitive_config = _parse_json(decrypted_data)
                 
                 # Update security configuration
-                for key, value in sensitive_config.get("security", {}).items():
-                    if hasattr(self.security_config, key):
-                        setattr(self.security_config, key, value)
+                self._apply_values("security", self.security_config, sensitive_config.get("security", {}))
                         
         except Exception as e:
             self.logger.warning(f"Could not load encrypted configuration: {e}")
@@ -340,14 +508,11 @@ class ConfigManager:
         """
         try:
             sensitive_data = {
-                "security": asdict(self.security_config)
+                "security": self.security_config.to_dict()
             }
             
-            json_data = json.dumps(sensitive_data)
-            encrypted_data = self.encrypt_sensitive_data(json_data)
-            
-            with open(self.encrypted_config_file, "w", encoding="utf-8") as f:
-                f.write(encrypted_data)
+            encrypted_data = self._encrypt_bytes(_dump_json(sensitive_data, indent=False))
+            self.encrypted_config_file.write_bytes(encrypted_data)
                 
         except Exception as e:
             self.logger.error(f"Failed to save encrypted configuration: {e}")
@@ -358,28 +523,51 @@ class ConfigManager:
         Получить всю конфигурацию как словарь
         """
         return {
-            "application": asdict(self.app_config),
-            "database": asdict(self.db_config),
-            "ui": asdict(self.ui_config),
-            "security": asdict(self.security_config),
-            "notifications": asdict(self.notification_config)
+            "application": self.app_config.to_dict(),
+            "database": self.db_config.to_dict(),
+            "ui": self.ui_config.to_dict(),
+            "security": self.security_config.to_dict(),
+            "notifications": self.notification_config.to_dict()
         }
         
+    @property
+    def is_dirty(self) -> bool:
+        """
+        Whether settings changed since the last save
+        Изменились ли настройки с момента последнего сохранения
+        """
+        # Direct field assignments (config_manager.ui_config.theme = ...) mark their section
+        return self._dirty or any(
+            getattr(section, "_modified", False) for section in self._section_objects().values()
+        )
+        
+    def _mark_clean(self):
+        """
+        Reset change tracking after a save
+        Сброс отслеживания изменений после сохранения
+        """
+        self._dirty = False
+        for section in self._section_objects().values():
+            object.__setattr__(section, "_modified", False)
+        
+    def snapshot(self) -> SimpleNamespace:
+        """
+        Get a read-only attribute view of the current configuration
+        Получить снимок текущей конфигурации с доступом через атрибуты
+        """
+        return SimpleNamespace(**{
+            section: SimpleNamespace(**values)
+            for section, values in self.get_config().items()
+        })
+        
     def get_setting(self, section: str, key: str, default: Any = None) -> Any:
         """
         Get a specific configuration setting
         Получить конкретную настройку конфигурации
         """
-        config_map = {
-            "application": self.app_config,
-            "database": self.db_config,
-            "ui": self.ui_config,
-            "security": self.security_config,
-            "notifications": self.notification_config
-        }
-        
-        if section in config_map:
-            return getattr(config_map[section], key, default)
+        config_obj = self._section_objects().get(section)
+        if config_obj is not None:
+            return getattr(config_obj, key, default)
         return default
         
     def set_setting(self, section: str, key: str, value: Any) -> bool:
@@ -387,16 +575,10 @@ class ConfigManager:
         Set a specific configuration setting
         Установить конкретную настройку конфигурации
         """
-        config_map = {
-            "application": self.app_config,
-            "database": self.db_config,
-            "ui": self.ui_config,
-            "security": self.security_config,
-            "notifications": self.notification_config
-        }
-        
-        if section in config_map and hasattr(config_map[section], key):
-            setattr(config_map[section], key, value)
+        config_obj = self._section_objects().get(section)
+        if config_obj is not None and key in _SECTION_FIELDS[section]:
+            setattr(config_obj, key, value)
+            self._dirty = True
             return True
         return False
         
@@ -419,10 +601,11 @@ class ConfigManager:
         self.ui_config.language = self.qt_settings.value("language", self.ui_config.language)
         self.ui_config.font_family = self.qt_settings.value("fontFamily", self.ui_config.font_family)
         self.ui_config.font_size = int(self.qt_settings.value("fontSize", self.ui_config.font_size))
+        self._dirty = True
         
-    def save_user_preferences(self):
+    def save_user_preferences(self, flush: bool = False):
         """
-        Save user preferences to Qt settings
+        Save user preferences to Qt settings (disk sync is debounced unless flush)
         Сохранение пользовательских предпочтений в настройки Qt
         """
         # Save window geometry and state
@@ -438,6 +621,21 @@ class ConfigManager:
         self.qt_settings.setValue("fontFamily", self.ui_config.font_family)
         self.qt_settings.setValue("fontSize", self.ui_config.font_size)
         
+        # setValue only updates Qt's in-memory cache; coalesce rapid saves into one disk write
+        if flush:
+            self._sync_qt_settings()
+        elif not self._sync_pending:
+            self._sync_pending = True
+            from PyQt6.QtCore import QTimer
+            
+            QTimer.singleShot(SETTINGS_SYNC_DELAY_MS, self._sync_qt_settings)
+            
+    def _sync_qt_settings(self):
+        """
+        Write pending Qt settings to disk
+        Запись отложенных настроек Qt на диск
+        """
+        self._sync_pending = False
         self.qt_settings.sync()
         
     def reset_to_defaults(self):
@@ -450,6 +648,7 @@ class ConfigManager:
         self.ui_config = UIConfig()
         self.security_config = SecurityConfig()
         self.notification_config = NotificationConfig()
+        self._dirty = True
         
         # Clear Qt settings
         self.qt_settings.clear()
@@ -466,11 +665,9 @@ class ConfigManager:
             backup_dir = self.config_dir / "backups"
             backup_dir.mkdir(exist_ok=True)
             
-            backup_file = backup_dir / f"config_backup_{timestamp}.yaml"
+            backup_file = backup_dir / f"config_backup_{timestamp}.json"
             
-            config_data = self.get_config()
-            with open(backup_file, "w", encoding="utf-8") as f:
-                yaml.dump(config_data, f, default_flow_style=False, allow_unicode=True)
+            backup_file.write_bytes(_dump_json(self.get_config()))
                 
             self.logger.info(f"Configuration backup created: {backup_file}")
             return True
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Shared test fixtures - Общие фикстуры тестов
+"""
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+import app.models as models
+from app.models.base import Base
+
+
+@pytest.fixture
+def engine():
+    """In-memory SQLite engine with the current schema"""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def session(engine):
+    """ORM session with default expire_on_commit"""
+    with Session(engine) as session:
+        yield session
+
+
+@pytest.fixture
+def user(session):
+    """Persisted user"""
+    user = models.User(
+        username="ivanov", email="ivanov@example.com", password_hash="x" * 60,
+        first_name="Иван", last_name="Иванов"
+    )
+    session.add(user)
+    session.commit()
+    return user
+
+
+@pytest.fixture
+def project(session, user):
+    """Persisted project created by user"""
+    project = models.Project(name="Проект", code="PRJ", creator_id=user.id)
+    session.add(project)
+    session.commit()
+    return project
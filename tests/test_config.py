@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Configuration tests - Тесты конфигурации
+"""
+
+import json
+
+import pytest
+
+from config import ConfigManager
+
+
+@pytest.fixture
+def manager(tmp_path):
+    """Config manager writing into a temporary directory"""
+    return ConfigManager(tmp_path)
+
+
+def test_direct_assignment_is_saved_after_first_save(manager, tmp_path):
+    manager.set_setting("ui", "theme", "light")
+    assert manager.save_config()
+    assert not manager.is_dirty
+
+    manager.ui_config.theme = "dark"
+    assert manager.is_dirty
+    assert manager.save_config()
+
+    saved = json.loads((tmp_path / "config.json").read_text(encoding="utf-8"))
+    assert saved["ui"]["theme"] == "dark"
+    assert not manager.is_dirty
+
+
+def test_legacy_yaml_config_is_migrated_and_round_trips(manager, tmp_path):
+    yaml = pytest.importorskip("yaml")
+    (tmp_path / "config.yaml").write_text(
+        yaml.dump({"ui": {"theme": "dark", "window_state": b"\x00\x01"}, "database": {"port": 6543}}),
+        encoding="utf-8"
+    )
+
+    assert manager.load_config()
+    assert (manager.ui_config.theme, manager.db_config.port) == ("dark", 6543)
+    assert manager.ui_config.window_state == b"\x00\x01"
+    assert (tmp_path / "config.json").exists()
+
+    manager.set_setting("ui", "font_size", 11)
+    assert manager.save_config()
+
+    reloaded = ConfigManager(tmp_path)
+    assert reloaded.load_config()
+    assert (reloaded.ui_config.theme, reloaded.ui_config.font_size) == ("dark", 11)
+    assert reloaded.ui_config.window_state == b"\x00\x01"
+    assert reloaded.db_config.port == 6543
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Schema upgrade tests - Тесты обновления схемы
+"""
+
+from sqlalchemy import create_engine, inspect, select
+from sqlalchemy.orm import Session
+
+from app.db.connection import Database
+from app.db.migrations import OBSOLETE_INDEXES, SCHEMA_VERSION, upgrade_schema
+from app.models import User, UserRole, UserStatus
+from app.models.base import Base
+
+
+def _create_pre_series_database(url):
+    """Current tables reshaped the way earlier releases left them"""
+    engine = create_engine(url)
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add(User(
+            username="ivanov", email="ivanov@example.com", password_hash="x" * 60,
+            first_name="Иван", last_name="Иванов", role=UserRole.ADMIN
+        ))
+        session.commit()
+    with engine.begin() as conn:
+        # Earlier releases stored enum member names
+        conn.exec_driver_sql("UPDATE users SET role = 'ADMIN', status = 'ACTIVE'")
+        conn.exec_driver_sql("ALTER TABLE users DROP COLUMN full_name_cached")
+        conn.exec_driver_sql("CREATE INDEX ix_attachments_file_hash ON attachments (file_hash)")
+        conn.exec_driver_sql("CREATE INDEX idx_user_email_active ON users (email) WHERE status = 'ACTIVE'")
+        conn.exec_driver_sql("DROP INDEX idx_attachment_hash")
+        conn.exec_driver_sql("CREATE INDEX idx_attachment_hash ON attachments (file_hash)")
+        conn.exec_driver_sql("PRAGMA user_version = 0")
+    engine.dispose()
+
+
+def test_upgrade_pre_series_database(tmp_path):
+    url = f"sqlite:///{tmp_path / 'app.db'}"
+    _create_pre_series_database(url)
+
+    db = Database(url)
+    db.ensure_initialized()
+
+    with db.engine.connect() as conn:
+        assert conn.exec_driver_sql("SELECT role, status FROM users").one() == ("admin", "active")
+        assert conn.exec_driver_sql("PRAGMA user_version").scalar() == SCHEMA_VERSION
+        indexes = {ix["name"]: ix["column_names"] for ix in inspect(conn).get_indexes("attachments")}
+        indexes.update((ix["name"], ix["column_names"]) for ix in inspect(conn).get_indexes("users"))
+    assert not set(OBSOLETE_INDEXES) & set(indexes)
+    assert indexes["idx_attachment_hash"] == ["file_hash", "task_id", "project_id"]
+
+    with Session(db.engine) as session:
+        user = session.scalars(select(User)).one()
+        assert (user.role, user.status) == (UserRole.ADMIN, UserStatus.ACTIVE)
+        assert user.full_name_cached == "Иванов Иван"
+
+    # Every step is idempotent
+    with db.engine.begin() as conn:
+        upgrade_schema(conn)
+    with db.engine.connect() as conn:
+        assert conn.exec_driver_sql("SELECT role, status FROM users").one() == ("admin", "active")
+    db.engine.dispose()
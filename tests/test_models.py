@@ -1 +1,111 @@
-# stub
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Model tests - Тесты моделей
+"""
+
+from pathlib import Path
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.models import Attachment, Project, Task, TaskStatus
+from app.models.task import compute_startable_tasks, order_tasks_by_dependencies
+
+
+def test_commit_after_creator_only_held_by_task(engine, project, user):
+    """Expiring a task must not break on its collected joined-loaded creator"""
+    with Session(engine) as session:
+        session.add(Task(title="Задача", project_id=project.id, creator_id=user.id))
+        session.commit()
+
+    with Session(engine) as session:
+        task = session.get(Task, 1)
+        task.title = "Изменено"
+        session.commit()
+
+        assert session.get(Task, 1).title == "Изменено"
+
+
+def _add_tasks(session, project, user, *statuses):
+    tasks = [
+        Task(title=f"Задача {i}", project_id=project.id, creator_id=user.id, status=status)
+        for i, status in enumerate(statuses)
+    ]
+    session.add_all(tasks)
+    session.flush()
+    return tasks
+
+
+def test_compute_startable_tasks(session, project, user):
+    done, todo, blocked, free = _add_tasks(
+        session, project, user, TaskStatus.DONE, TaskStatus.TODO, TaskStatus.TODO, TaskStatus.TODO
+    )
+    todo.dependencies.append(done)
+    blocked.dependencies.extend([done, todo])
+    session.flush()
+
+    startable = compute_startable_tasks(session, project.id)
+
+    assert startable == {done.id, todo.id, free.id}
+    assert compute_startable_tasks(session, project.id, [blocked.id, free.id]) == {free.id}
+    assert not blocked.can_start()
+    assert todo.can_start(startable)
+
+
+def test_order_tasks_by_dependencies(session, project, user):
+    first, second, third = _add_tasks(session, project, user, TaskStatus.TODO, TaskStatus.TODO, TaskStatus.TODO)
+    third.dependencies.append(second)
+    second.dependencies.append(first)
+    session.flush()
+
+    assert order_tasks_by_dependencies(session, project.id) == [first.id, second.id, third.id]
+
+    first.dependencies.append(third)
+    session.flush()
+    with pytest.raises(ValueError):
+        order_tasks_by_dependencies(session, project.id)
+
+
+def test_project_task_counts_in_python_and_sql(session, project, user):
+    _add_tasks(session, project, user, TaskStatus.DONE, TaskStatus.DONE, TaskStatus.TODO)
+    session.commit()
+
+    # Unloaded collection: counted with a query
+    assert (project.task_count, project.completed_task_count) == (3, 2)
+    assert project.calculate_progress() == 66
+
+    # Loaded collection: counted in Python
+    loaded = Project.with_progress_stats(session, [project.id])[0]
+    assert (loaded.task_count, loaded.completed_task_count) == (3, 2)
+
+    # Class-level expressions
+    row = session.execute(
+        select(Project.task_count, Project.completed_task_count).where(Project.id == project.id)
+    ).one()
+    assert tuple(row) == (3, 2)
+    assert session.scalars(select(Project.id).where(Project.completed_task_count >= 2)).all() == [project.id]
+
+
+def test_attachment_find_or_create_deduplicates(session, project, user, tmp_path):
+    first, second = _add_tasks(session, project, user, TaskStatus.TODO, TaskStatus.TODO)
+    content = b"%PDF-1.4 report"
+
+    attachment = Attachment.find_or_create(
+        session, content, "report.pdf", "application/pdf", user.id, tmp_path, task_id=first.id
+    )
+    session.flush()
+    same = Attachment.find_or_create(
+        session, content, "copy.pdf", "application/pdf", user.id, tmp_path, task_id=first.id
+    )
+    other = Attachment.find_or_create(
+        session, content, "report.pdf", "application/pdf", user.id, tmp_path, task_id=second.id
+    )
+    session.flush()
+
+    assert same is attachment
+    assert other is not attachment
+    assert other.file_path == attachment.file_path
+    assert [p for p in tmp_path.rglob("*") if p.is_file()] == [Path(attachment.file_path)]
+    assert session.scalar(select(func.count(Attachment.id))) == 2
@@ -1 +1,111 @@
-# stub
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Service tests - Тесты сервисов
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import func, select
+
+from app.models import Task, UserNotification
+from app.services.auth_service import SessionManager
+from app.services.notification_service import (
+    MAX_IN_APP_NOTIFICATIONS, Notification, NotificationBuffer, NotificationService
+)
+from app.utils.export_manager import DataExporter
+from app.utils.security import MIN_BCRYPT_ROUNDS, get_bcrypt_rounds, needs_rehash, set_bcrypt_rounds
+
+
+def test_failed_notification_keeps_callers_pending_work(session, project, user):
+    service = NotificationService(session, config=None)
+    session.add(Task(title="Задача", project_id=project.id, creator_id=user.id))
+
+    # user_id is NOT NULL, so this insert fails inside the notification savepoint
+    assert not service.send_notification(Notification(id="broken", user_id=None))
+    session.commit()
+
+    assert session.scalar(select(func.count(Task.id))) == 1
+    assert session.scalar(select(func.count(UserNotification.id))) == 0
+
+
+def test_task_assigned_without_session_stores_in_app():
+    service = NotificationService(None, config=None)
+
+    assert service.send_task_assigned_notification({"id": 7, "title": "Задача"}, [1, 2])
+    assert [n.id for n in service.get_user_notifications(2)] == ["task_assigned_7_2"]
+
+
+def test_notification_buffer_keeps_index_in_sync():
+    index = {}
+    buffer = NotificationBuffer(index)
+    for i in range(MAX_IN_APP_NOTIFICATIONS + 5):
+        buffer.append(Notification(id=f"n{i}", user_id=1, created_at=datetime(2024, 1, 1) + timedelta(hours=i)))
+
+    assert len(buffer) == len(index) == MAX_IN_APP_NOTIFICATIONS
+    assert "n0" not in index
+
+    assert buffer.evict_older_than(datetime(2024, 1, 1, 9)) == 5
+    assert len(index) == MAX_IN_APP_NOTIFICATIONS - 5
+    assert [n.id for n in buffer] == sorted(index, key=lambda key: int(key[1:]))
+    assert not hasattr(buffer, "popleft")
+
+
+def test_bcrypt_cost_never_drops_below_floor():
+    previous = get_bcrypt_rounds()
+    try:
+        set_bcrypt_rounds(4)
+        assert get_bcrypt_rounds() == MIN_BCRYPT_ROUNDS >= 10
+        assert needs_rehash("$2b$04$" + "x" * 53)
+    finally:
+        set_bcrypt_rounds(previous)
+
+
+@pytest.mark.parametrize("export_format", list(DataExporter._FORMAT_DISPATCH))
+def test_exporters_return_content_when_writing_a_file(tmp_path, export_format):
+    filename = tmp_path / f"export.{export_format}"
+    rows = [{"ID": 1, "Название": "Задача", "Дата": datetime(2024, 5, 6)}]
+
+    content = DataExporter()._export_by_format(rows, export_format, str(filename))
+
+    assert isinstance(content, str)
+    assert filename.read_bytes().decode("utf-8") == content
+
+
+class FakeRedis:
+    """Minimal in-memory stand-in for the redis client calls SessionManager makes"""
+
+    def __init__(self):
+        self.store = {}
+
+    def setex(self, key, ttl, value):
+        self.store[key] = value
+
+    def pipeline(self):
+        redis = self
+
+        class Pipeline:
+            def __init__(self):
+                self.results = []
+
+            def get(self, key):
+                self.results.append(redis.store.get(key))
+
+            def expire(self, key, ttl):
+                self.results.append(key in redis.store)
+
+            def execute(self):
+                return self.results
+
+        return Pipeline()
+
+
+@pytest.mark.parametrize("redis_client", [None, FakeRedis()], ids=["memory", "redis"])
+def test_session_created_at_is_datetime_on_every_backend(user, redis_client):
+    sessions = SessionManager(config_manager=None, redis_client=redis_client)
+
+    session_data = sessions.validate_session(sessions.create_session(user))
+
+    assert session_data["user_id"] == user.id
+    assert isinstance(session_data["created_at"], datetime)